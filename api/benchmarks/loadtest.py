@@ -0,0 +1,201 @@
+"""
+Load generator for /tts/stream and /stt/stream.
+
+Runs each endpoint at increasing concurrency levels and reports throughput,
+time to first byte and latency percentiles. Meant to be pointed at an API whose
+ELEVENLABS_BASE_URL / GROQ_BASE_URL target the fake providers:
+
+    pdm run fake-providers &
+    pdm run start-dev &
+    pdm run loadtest --concurrency 1 8 32 128
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import statistics
+import time
+import wave
+from dataclasses import asdict, dataclass
+
+import httpx
+
+TTS_TEXT = (
+    "Heat the olive oil in a large pan over medium heat, add the sliced garlic "
+    "and cook until golden, stirring so it does not burn."
+)
+
+
+@dataclass
+class Sample:
+    ok: bool
+    status_code: int
+    ttfb: float
+    latency: float
+    received_bytes: int
+
+
+@dataclass
+class StageReport:
+    endpoint: str
+    concurrency: int
+    requests: int
+    errors: int
+    shed: int
+    duration_s: float
+    throughput_rps: float
+    ttfb_p50_ms: float
+    ttfb_p95_ms: float
+    ttfb_p99_ms: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+
+
+def _silent_wav(seconds: float, rate: int = 16_000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as audio:
+        audio.setnchannels(1)
+        audio.setsampwidth(2)
+        audio.setframerate(rate)
+        audio.writeframes(b"\x00\x00" * int(seconds * rate))
+    return buffer.getvalue()
+
+
+def _percentile(values: list[float], percentile: int) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percentile - 1]
+
+
+async def _timed_request(client: httpx.AsyncClient, endpoint: str, wav: bytes) -> Sample:
+    if endpoint == "tts":
+        request = client.build_request("POST", "/tts/stream", json={"text": TTS_TEXT})
+    else:
+        request = client.build_request(
+            "POST",
+            "/stt/stream",
+            files={"audio": ("sample.wav", wav, "audio/wav")},
+        )
+
+    start = time.perf_counter()
+    ttfb = None
+    received = 0
+    try:
+        response = await client.send(request, stream=True)
+        async for chunk in response.aiter_raw():
+            if ttfb is None:
+                ttfb = time.perf_counter() - start
+            received += len(chunk)
+        await response.aclose()
+    except httpx.HTTPError:
+        elapsed = time.perf_counter() - start
+        return Sample(ok=False, status_code=0, ttfb=elapsed, latency=elapsed, received_bytes=received)
+
+    latency = time.perf_counter() - start
+    return Sample(
+        ok=response.is_success,
+        status_code=response.status_code,
+        ttfb=ttfb if ttfb is not None else latency,
+        latency=latency,
+        received_bytes=received,
+    )
+
+
+async def run_stage(
+    base_url: str,
+    endpoint: str,
+    concurrency: int,
+    requests: int,
+    wav: bytes,
+    timeout: float,
+) -> StageReport:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    samples: list[Sample] = []
+    remaining = requests
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                samples.append(await _timed_request(client, endpoint, wav))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - start
+
+    succeeded = [sample for sample in samples if sample.ok]
+    ttfbs = sorted(sample.ttfb * 1000 for sample in succeeded)
+    latencies = sorted(sample.latency * 1000 for sample in succeeded)
+
+    return StageReport(
+        endpoint=endpoint,
+        concurrency=concurrency,
+        requests=len(samples),
+        errors=len(samples) - len(succeeded),
+        shed=sum(1 for sample in samples if sample.status_code in (429, 503)),
+        duration_s=duration,
+        throughput_rps=len(succeeded) / duration if duration else 0.0,
+        ttfb_p50_ms=_percentile(ttfbs, 50),
+        ttfb_p95_ms=_percentile(ttfbs, 95),
+        ttfb_p99_ms=_percentile(ttfbs, 99),
+        latency_p50_ms=_percentile(latencies, 50),
+        latency_p95_ms=_percentile(latencies, 95),
+        latency_p99_ms=_percentile(latencies, 99),
+    )
+
+
+def _print_report(report: StageReport) -> None:
+    print(
+        f"{report.endpoint:<5}{report.concurrency:>6}{report.requests:>7}{report.errors:>7}{report.shed:>7}"
+        f"{report.throughput_rps:>9.1f}"
+        f"{report.ttfb_p50_ms:>9.0f}{report.ttfb_p95_ms:>9.0f}{report.ttfb_p99_ms:>9.0f}"
+        f"{report.latency_p50_ms:>9.0f}{report.latency_p95_ms:>9.0f}{report.latency_p99_ms:>9.0f}"
+    )
+
+
+async def main(args: argparse.Namespace) -> list[StageReport]:
+    wav = _silent_wav(args.audio_seconds)
+    reports = []
+
+    print(
+        f"{'api':<5}{'conc':>6}{'reqs':>7}{'errs':>7}{'shed':>7}{'req/s':>9}"
+        f"{'ttfb50':>9}{'ttfb95':>9}{'ttfb99':>9}{'lat50':>9}{'lat95':>9}{'lat99':>9}"
+    )
+    for endpoint in args.endpoints:
+        for concurrency in args.concurrency:
+            report = await run_stage(
+                base_url=args.base_url,
+                endpoint=endpoint,
+                concurrency=concurrency,
+                requests=max(args.requests_per_worker * concurrency, args.min_requests),
+                wav=wav,
+                timeout=args.timeout,
+            )
+            _print_report(report)
+            reports.append(report)
+
+    return reports
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test the voice endpoints")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--endpoints", nargs="+", choices=["tts", "stt"], default=["tts", "stt"])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--requests-per-worker", type=int, default=10)
+    parser.add_argument("--min-requests", type=int, default=20)
+    parser.add_argument("--audio-seconds", type=float, default=3.0)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--json", dest="json_path", help="Also write the reports to this file")
+    args = parser.parse_args()
+
+    reports = asyncio.run(main(args))
+
+    if args.json_path:
+        with open(args.json_path, "w") as output:
+            json.dump([asdict(report) for report in reports], output, indent=2)
@@ -4,7 +4,7 @@ import sys
 
 import pydash as _
 from typing import cast, get_type_hints
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ValidationError, field_validator
 
 
 class Config(BaseModel):
@@ -13,6 +13,53 @@ class Config(BaseModel):
     PORT: int
     FAL_KEY: str
     GROQ_API_KEY: str
+    ELEVENLABS_BASE_URL: str | None = None
+    GROQ_BASE_URL: str | None = None
+    ELEVENLABS_RATE_PER_SECOND: float = 5
+    ELEVENLABS_BURST: int = 5
+    ELEVENLABS_MAX_CONCURRENCY: int = 5
+    ELEVENLABS_MAX_QUEUE: int = 50
+    GROQ_RATE_PER_SECOND: float = 5
+    GROQ_BURST: int = 10
+    GROQ_MAX_CONCURRENCY: int = 10
+    GROQ_MAX_QUEUE: int = 50
+    FAL_RATE_PER_SECOND: float = 5
+    FAL_BURST: int = 10
+    FAL_MAX_CONCURRENCY: int = 10
+    FAL_MAX_QUEUE: int = 50
+    ADMISSION_MAX_WAIT_SECONDS: float = 10
+    CREW_MAX_SESSIONS: int = 500
+    CREW_QUEUE_TIMEOUT_SECONDS: float = 60
+    CREW_SESSION_TTL_SECONDS: float = 3 * 60 * 60
+    CREW_IDLE_TIMEOUT_SECONDS: float = 15 * 60
+    CREW_ANSWER_TIMEOUT_SECONDS: float = 10 * 60
+    CREW_RESULT_RETENTION_SECONDS: float = 10 * 60
+    CREW_MAX_EVENTS_PER_SESSION: int = 16
+    CREW_HISTORY_SIZE: int = 100
+    SUBSTITUTION_CACHE_MAX_SIZE: int = 2048
+    SUBSTITUTION_CACHE_TTL_SECONDS: float = 7 * 24 * 60 * 60
+    SUBSTITUTION_CACHE_SIMILARITY: float = 0.85
+    STEP_WEBHOOK_SECRET: str | None = None
+    STEP_EVENTS_MAX_QUEUE: int = 100
+    STEP_EVENTS_HEARTBEAT_SECONDS: float = 15
+    STEP_TIMER_LEAD_SECONDS: float = 30
+    STEP_EVENTS_MAX_RECIPES: int = 1000
+    STEP_EVENTS_RECIPE_TTL_SECONDS: float = 6 * 60 * 60
+    SUPABASE_URL: str | None = None
+    SUPABASE_ANON_KEY: str | None = None
+    SUPABASE_TIMEOUT_SECONDS: float = 5
+
+    @field_validator(
+        "ELEVENLABS_BASE_URL",
+        "GROQ_BASE_URL",
+        "SUPABASE_URL",
+        "SUPABASE_ANON_KEY",
+        mode="before",
+    )
+    @classmethod
+    def empty_as_unset(cls, value: object) -> object:
+        # An empty value in .env means unset (SDK default), not base_url=""
+        return value or None
 
     @property
     def DOCS_URL(self) -> str | None:
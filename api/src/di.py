@@ -1,8 +1,19 @@
+from functools import partial
+
 from injector import Module, provider, singleton
 from elevenlabs.client import ElevenLabs
 
 from src.initializer import Initializer
 from src.config import config
+from src.infra.services.admission import ProviderLimiter
+from src.infra.services.crewai import CookingCrew
+from src.infra.services.elevenlabs import ElevenlabsService
+from src.infra.services.fal import FalService
+from src.infra.services.groq import GroqService
+from src.infra.services.sessions import CrewSessionManager
+from src.infra.services.step_events import StepEventHub
+from src.infra.services.substitution_cache import SubstitutionCache
+from src.infra.services.supabase import SupabaseService
 
 
 class DiModule(Module):
@@ -14,3 +25,87 @@ class DiModule(Module):
             host=config.HOST,
             port=config.PORT,
         )
+
+    @singleton
+    @provider
+    def provide_elevenlabs_service(self) -> ElevenlabsService:
+        return ElevenlabsService(
+            limiter=ProviderLimiter(
+                name="elevenlabs",
+                rate_per_second=config.ELEVENLABS_RATE_PER_SECOND,
+                burst=config.ELEVENLABS_BURST,
+                max_concurrency=config.ELEVENLABS_MAX_CONCURRENCY,
+                max_queue=config.ELEVENLABS_MAX_QUEUE,
+                max_wait=config.ADMISSION_MAX_WAIT_SECONDS,
+            ),
+        )
+
+    @singleton
+    @provider
+    def provide_groq_service(self) -> GroqService:
+        return GroqService(
+            limiter=ProviderLimiter(
+                name="groq",
+                rate_per_second=config.GROQ_RATE_PER_SECOND,
+                burst=config.GROQ_BURST,
+                max_concurrency=config.GROQ_MAX_CONCURRENCY,
+                max_queue=config.GROQ_MAX_QUEUE,
+                max_wait=config.ADMISSION_MAX_WAIT_SECONDS,
+            ),
+        )
+
+    @singleton
+    @provider
+    def provide_fal_service(self) -> FalService:
+        return FalService(
+            limiter=ProviderLimiter(
+                name="fal",
+                rate_per_second=config.FAL_RATE_PER_SECOND,
+                burst=config.FAL_BURST,
+                max_concurrency=config.FAL_MAX_CONCURRENCY,
+                max_queue=config.FAL_MAX_QUEUE,
+                max_wait=config.ADMISSION_MAX_WAIT_SECONDS,
+            ),
+        )
+
+    @singleton
+    @provider
+    def provide_substitution_cache(self) -> SubstitutionCache:
+        return SubstitutionCache(
+            max_size=config.SUBSTITUTION_CACHE_MAX_SIZE,
+            ttl=config.SUBSTITUTION_CACHE_TTL_SECONDS,
+            similarity_threshold=config.SUBSTITUTION_CACHE_SIMILARITY,
+        )
+
+    @singleton
+    @provider
+    def provide_crew_session_manager(
+        self,
+        substitution_cache: SubstitutionCache,
+    ) -> CrewSessionManager:
+        return CrewSessionManager(
+            crew_factory=partial(CookingCrew, substitution_cache=substitution_cache),
+            max_sessions=config.CREW_MAX_SESSIONS,
+            session_ttl=config.CREW_SESSION_TTL_SECONDS,
+            queue_timeout=config.CREW_QUEUE_TIMEOUT_SECONDS,
+            idle_timeout=config.CREW_IDLE_TIMEOUT_SECONDS,
+            answer_timeout=config.CREW_ANSWER_TIMEOUT_SECONDS,
+            result_retention=config.CREW_RESULT_RETENTION_SECONDS,
+            max_events=config.CREW_MAX_EVENTS_PER_SESSION,
+            history_size=config.CREW_HISTORY_SIZE,
+        )
+
+    @singleton
+    @provider
+    def provide_supabase_service(self) -> SupabaseService:
+        return SupabaseService()
+
+    @singleton
+    @provider
+    def provide_step_event_hub(self) -> StepEventHub:
+        return StepEventHub(
+            max_queue=config.STEP_EVENTS_MAX_QUEUE,
+            lead=config.STEP_TIMER_LEAD_SECONDS,
+            max_recipes=config.STEP_EVENTS_MAX_RECIPES,
+            recipe_ttl=config.STEP_EVENTS_RECIPE_TTL_SECONDS,
+        )
@@ -1,5 +1,17 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Literal
+
 from fastapi import UploadFile, File
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
+
+from src.domain.scheduler import Step, schedule_steps
+
+
+class RequestPriority(StrEnum):
+    LIVE = "live"
+    BACKGROUND = "background"
+
 
 class TextMessage(BaseModel):
     text: str
@@ -7,3 +19,85 @@ class TextMessage(BaseModel):
 
 class AudioMessage(BaseModel):
     audio: UploadFile = File(...)
+
+
+class TimedRecipeStep(BaseModel):
+    name: str
+    duration: int = Field(..., ge=0, description="Minutes")
+    step_type: Literal["passive", "partial", "active"]
+    predecessors: list[str] = Field(default_factory=list)
+
+
+class Recipe(BaseModel):
+    name: str
+    ingredients: list[str]
+    # Timed steps are scheduled directly instead of by the time keeper agent
+    steps: list[str] | list[TimedRecipeStep]
+    max_partial: int = Field(2, ge=1)
+
+    @model_validator(mode="after")
+    def check_steps(self) -> "Recipe":
+        if not self.steps:
+            raise ValueError("A recipe needs at least one step.")
+
+        if isinstance(self.steps[0], TimedRecipeStep):
+            # Reject a graph that can't be scheduled before a crew is started for it
+            schedule_steps([Step(**step.model_dump()) for step in self.steps], self.max_partial)
+        return self
+
+
+class CookingSessionRequest(BaseModel):
+    recipe: Recipe
+    available_ingredients: list[str] = Field(default_factory=list)
+
+
+class CookingSessionAnswer(BaseModel):
+    text: str
+    question_id: str | None = None
+
+
+class CookingSessionState(BaseModel):
+    session_id: str
+    status: str
+    pending_questions: list[str] = Field(default_factory=list)
+    result: str | None = None
+    error: str | None = None
+
+
+class SubstitutionCacheMetrics(BaseModel):
+    size: int
+    hits: int
+    semantic_hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    hit_rate: float
+
+
+class StepStatus(StrEnum):
+    UNABLE_TO_START = "unable_to_start"
+    READY_TO_START = "ready_to_start"
+    IN_PROGRESS = "in_progress"
+    READY_TO_FINISH = "ready_to_finish"
+    FINISHED = "finished"
+
+
+class RecipeStep(BaseModel):
+    id: str
+    recipe_id: str
+    step_number: int
+    description: str
+    status: StepStatus = StepStatus.READY_TO_START
+    predicted_start_time: datetime | None = None
+    predicted_end_time: datetime | None = None
+    actual_start_time: datetime | None = None
+    actual_end_time: datetime | None = None
+
+
+class RecipeStepWebhook(BaseModel):
+    """Payload of a Supabase database webhook on the recipe_steps table."""
+
+    type: Literal["INSERT", "UPDATE", "DELETE"]
+    table: str
+    record: RecipeStep | None = None
+    old_record: RecipeStep | None = None
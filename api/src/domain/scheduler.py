@@ -0,0 +1,91 @@
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Hashable, Literal
+
+StepType = Literal["passive", "partial", "active"]
+
+
+@dataclass
+class Step:
+    name: str
+    duration: int
+    step_type: StepType
+    predecessors: list[Hashable] = field(default_factory=list)
+
+
+def recipe_topo_sort(
+    steps: dict[Hashable, Step],
+    max_partial: int,
+) -> list[tuple[str, int, int]]:
+    """
+    Schedule recipe steps respecting dependencies and step type constraints.
+
+    Only one active step runs at a time, at most ``max_partial`` partial steps
+    run concurrently and passive steps start as soon as their predecessors are
+    done. Steps caught in a dependency cycle are left out of the result.
+
+    Returns (name, start, finish) tuples ordered by start time.
+    """
+    successors: dict[Hashable, list[Hashable]] = {key: [] for key in steps}
+    for key, step in steps.items():
+        for pred in step.predecessors:
+            successors[pred].append(key)
+
+    in_degrees = {key: len(step.predecessors) for key, step in steps.items()}
+    queue = deque(key for key in steps if in_degrees[key] == 0)
+    topo_order: list[Hashable] = []
+
+    while queue:
+        current = queue.popleft()
+        topo_order.append(current)
+        for successor in successors[current]:
+            in_degrees[successor] -= 1
+            if in_degrees[successor] == 0:
+                queue.append(successor)
+
+    active_avail = 0
+    partial_slots = [0] * max_partial
+    start_times: dict[Hashable, int] = {}
+    finish_times: dict[Hashable, int] = {}
+
+    for key in topo_order:
+        step = steps[key]
+        dep_time = max((finish_times[pred] for pred in step.predecessors), default=0)
+
+        if step.step_type == "active":
+            start_time = max(dep_time, active_avail)
+            active_avail = start_time + step.duration
+        elif step.step_type == "partial":
+            start_time = max(dep_time, heapq.heappop(partial_slots))
+            heapq.heappush(partial_slots, start_time + step.duration)
+        else:
+            start_time = dep_time
+
+        start_times[key] = start_time
+        finish_times[key] = start_time + step.duration
+
+    ordered = sorted(topo_order, key=lambda key: start_times[key])
+    return [(steps[key].name, start_times[key], finish_times[key]) for key in ordered]
+
+
+def schedule_steps(steps: list[Step], max_partial: int) -> str:
+    """Schedule the steps with recipe_topo_sort and format the timeline, ValueError on an invalid graph."""
+    if max_partial < 1:
+        raise ValueError("max_partial must be at least 1.")
+
+    recipe_steps = {step.name: step for step in steps}
+    if len(recipe_steps) < len(steps):
+        raise ValueError("Step names must be unique.")
+
+    unknown = {pred for step in steps for pred in step.predecessors} - recipe_steps.keys()
+    if unknown:
+        raise ValueError(f"Unknown predecessor steps: {', '.join(sorted(unknown))}.")
+
+    schedule = recipe_topo_sort(recipe_steps, max_partial)
+    if len(schedule) < len(recipe_steps):
+        raise ValueError("The step dependencies contain a cycle.")
+
+    lines = [f"{start:>4}-{finish:<4} min: {name}" for name, start, finish in schedule]
+    total = max(finish for _, _, finish in schedule) if schedule else 0
+    return "\n".join(lines + [f"Total time: {total} min"])
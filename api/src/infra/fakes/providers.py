@@ -0,0 +1,133 @@
+"""
+Local stand-ins for the ElevenLabs streaming TTS and Groq transcription APIs.
+
+Point ELEVENLABS_BASE_URL and GROQ_BASE_URL at this server to exercise
+/tts/stream and /stt/stream without spending provider quota:
+
+    python -B -m src.infra.fakes.providers --port 9000
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import uuid
+from typing import AsyncIterator
+
+import uvicorn
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+
+class LatencyDistribution(BaseModel):
+    """Log-normal latency given its median and shape, in milliseconds."""
+
+    median_ms: float
+    sigma: float = 0.5
+    max_ms: float = 30_000
+
+    def sample(self, rng: random.Random) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+
+        value = rng.lognormvariate(math.log(self.median_ms), self.sigma)
+        return min(value, self.max_ms) / 1000
+
+
+class FakeProviderSettings(BaseModel):
+    TTS_FIRST_CHUNK_LATENCY: LatencyDistribution = LatencyDistribution(median_ms=300)
+    TTS_CHUNK_INTERVAL: LatencyDistribution = LatencyDistribution(median_ms=40, sigma=0.3)
+    TTS_CHUNK_SIZE: int = 1024
+    TTS_CHUNKS_PER_100_CHARS: int = 24
+    TTS_ERROR_RATE: float = 0.0
+    STT_LATENCY: LatencyDistribution = LatencyDistribution(median_ms=400)
+    STT_LATENCY_PER_MB: LatencyDistribution = LatencyDistribution(median_ms=150, sigma=0.2)
+    STT_ERROR_RATE: float = 0.0
+    STT_TRANSCRIPTION: str = "Add the garlic and stir for one minute."
+    SEED: int | None = None
+
+    @classmethod
+    def from_env(cls, prefix: str = "FAKE_") -> "FakeProviderSettings":
+        """
+        Read overrides such as FAKE_TTS_ERROR_RATE=0.05 or
+        FAKE_TTS_FIRST_CHUNK_LATENCY='{"median_ms": 500, "sigma": 0.8}'.
+        """
+        variables = {
+            name: os.environ[f"{prefix}{name}"]
+            for name in cls.model_fields
+            if f"{prefix}{name}" in os.environ
+        }
+        for name, value in list(variables.items()):
+            if cls.model_fields[name].annotation is LatencyDistribution:
+                variables[name] = LatencyDistribution.model_validate_json(value)
+
+        return cls.model_validate(variables)
+
+
+def _error_response(status_code: int, message: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"detail": {"status": "fake_error", "message": message}},
+    )
+
+
+def create_app(settings: FakeProviderSettings | None = None) -> FastAPI:
+    settings = settings or FakeProviderSettings.from_env()
+    rng = random.Random(settings.SEED)
+    audio_chunk = rng.randbytes(settings.TTS_CHUNK_SIZE)
+
+    app = FastAPI(title="Fake providers")
+
+    def should_fail(error_rate: float) -> bool:
+        return error_rate > 0 and rng.random() < error_rate
+
+    @app.post("/v1/text-to-speech/{voice_id}/stream")
+    async def text_to_speech_stream(voice_id: str, request: Request):
+        body = await request.json()
+        if should_fail(settings.TTS_ERROR_RATE):
+            await asyncio.sleep(settings.TTS_FIRST_CHUNK_LATENCY.sample(rng))
+            return _error_response(status.HTTP_429_TOO_MANY_REQUESTS, "Too many concurrent requests")
+
+        text = body.get("text") or ""
+        chunks = max(1, math.ceil(len(text) / 100 * settings.TTS_CHUNKS_PER_100_CHARS))
+
+        async def stream() -> AsyncIterator[bytes]:
+            await asyncio.sleep(settings.TTS_FIRST_CHUNK_LATENCY.sample(rng))
+            for index in range(chunks):
+                if index:
+                    await asyncio.sleep(settings.TTS_CHUNK_INTERVAL.sample(rng))
+                yield audio_chunk
+
+        return StreamingResponse(stream(), media_type="audio/mpeg")
+
+    @app.post("/openai/v1/audio/transcriptions")
+    async def audio_transcriptions(request: Request):
+        form = await request.form()
+        audio = await form["file"].read()
+        delay = settings.STT_LATENCY.sample(rng)
+        delay += settings.STT_LATENCY_PER_MB.sample(rng) * len(audio) / 1_000_000
+        await asyncio.sleep(delay)
+
+        if should_fail(settings.STT_ERROR_RATE):
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"error": {"message": "Service unavailable", "type": "fake_error"}},
+            )
+
+        return {
+            "text": settings.STT_TRANSCRIPTION,
+            "x_groq": {"id": f"req_{uuid.uuid4().hex}"},
+        }
+
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run fake ElevenLabs and Groq APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(), host=args.host, port=args.port, log_level="warning")
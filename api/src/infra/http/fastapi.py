@@ -1,15 +1,40 @@
-from fastapi import FastAPI, status
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from fastapi_injector import attach_injector
+from injector import Injector
 
 from src.config import config
 from src.di import DiModule
 from src.infra.http.router import router
+from src.infra.services.admission import AdmissionRejectedError
+from src.infra.services.sessions import CrewSessionManager
+from src.infra.services.step_events import StepEventHub
+from src.infra.services.supabase import SupabaseService
+
+injector = Injector([DiModule])
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    sessions = injector.get(CrewSessionManager)
+    await sessions.start()
+    yield
+    await sessions.stop()
+    injector.get(StepEventHub).stop()
+    await injector.get(SupabaseService).close()
+
 
 app = FastAPI(
     docs_url=config.DOCS_URL,
     redoc_url=config.REDOC_URL,
+    lifespan=lifespan,
 )
 
+attach_injector(app, injector)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -20,6 +45,16 @@ app.add_middleware(
 
 app.include_router(router)
 
+
+@app.exception_handler(AdmissionRejectedError)
+async def _admission_rejected(_: Request, error: AdmissionRejectedError) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(error), "provider": error.provider},
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
 @app.get(
     "/healthz",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -1,17 +1,48 @@
+import asyncio
+import json
+import secrets
+from functools import partial
 from typing import AsyncIterator
 from fastapi.responses import StreamingResponse
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, File, Header, HTTPException, Query, Request, Response, UploadFile, WebSocket, WebSocketDisconnect, status
+from fastapi_injector import Injected
 import tempfile
 import os
 
+from src.infra.services.admission import Priority
 from src.infra.services.fal import FalService
 from src.infra.services.groq import GroqService
 from src.infra.services.elevenlabs import ElevenlabsService
-from src.domain.models import Message, AudioMessage
+from src.infra.services.sessions import (
+    CrewSession,
+    CrewSessionManager,
+    SessionClosedError,
+    SessionLimitError,
+    SessionNotFoundError,
+    UnknownQuestionError,
+)
+from src.infra.services.step_events import StepEventHub
+from src.infra.services.substitution_cache import SubstitutionCache
+from src.infra.services.supabase import SupabaseAuthError, SupabaseService
+from src.config import config
+from src.domain.models import (
+    RecipeStepWebhook,
+    RequestPriority,
+    TextMessage,
+    AudioMessage,
+    CookingSessionAnswer,
+    CookingSessionRequest,
+    CookingSessionState,
+    SubstitutionCacheMetrics,
+)
 
 router = APIRouter()
 
 
+def _priority(value: RequestPriority) -> Priority:
+    return Priority[value.name]
+
+
 @router.post(
     "/tts/stream",
     summary=f"Publish the data to receive audio from LLM",
@@ -21,8 +52,12 @@ router = APIRouter()
     status_code=status.HTTP_200_OK,
     response_model=bytes
 )
-async def tts_stream(request: Message):
-    text_audio = ElevenlabsService().generate(text=request.text)
+async def tts_stream(
+    request: TextMessage,
+    priority: RequestPriority = Header(default=RequestPriority.LIVE, alias="X-Request-Priority"),
+    elevenlabs: ElevenlabsService = Injected(ElevenlabsService),
+):
+    text_audio = await elevenlabs.generate(text=request.text, priority=_priority(priority))
 
     return StreamingResponse(text_audio, media_type="audio/mpeg")
 
@@ -35,15 +70,330 @@ async def tts_stream(request: Message):
     ),
     status_code=status.HTTP_200_OK,
 )
-async def stt_stream(request: AudioMessage) -> None:
-    fd, tmp_file_path = tempfile.mkstemp(suffix='.wav', dir='./src/tmp')
+async def stt_stream(
+    audio: UploadFile = File(...),
+    priority: RequestPriority = Header(default=RequestPriority.LIVE, alias="X-Request-Priority"),
+    groq: GroqService = Injected(GroqService),
+):
+    fd, tmp_file_path = tempfile.mkstemp(suffix='.wav')
+
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            audio_data = await audio.read()
+            tmp_file.write(audio_data)
+
+        transcription = await groq.stt(
+            audio_file_path=tmp_file_path,
+            priority=_priority(priority),
+        )
+    finally:
+        os.remove(tmp_file_path)
+
+    return {"transcription": transcription}
+
+
+def _get_session(sessions: CrewSessionManager, session_id: str) -> CrewSession:
+    try:
+        return sessions.get(session_id)
+    except SessionNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cooking session not found",
+        )
+
+
+def _session_state(session: CrewSession) -> CookingSessionState:
+    return CookingSessionState(
+        session_id=session.id,
+        status=session.status,
+        pending_questions=session.pending_questions,
+        result=session.result,
+        error=session.error,
+    )
+
+
+@router.post(
+    "/sessions",
+    summary="Start a cooking session",
+    description=(
+        "Start a CookingCrew for the recipe; its questions are delivered "
+        "through the session events"
+    ),
+    status_code=status.HTTP_201_CREATED,
+    response_model=CookingSessionState,
+)
+async def create_session(
+    request: CookingSessionRequest,
+    sessions: CrewSessionManager = Injected(CrewSessionManager),
+):
+    try:
+        session = sessions.create(
+            recipe=request.recipe.model_dump(),
+            available_ingredients=request.available_ingredients,
+        )
+    except SessionLimitError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many active cooking sessions",
+            headers={"Retry-After": "30"},
+        )
+
+    return _session_state(session)
+
+
+@router.get(
+    "/sessions/{session_id}",
+    summary="Get the state of a cooking session",
+    status_code=status.HTTP_200_OK,
+    response_model=CookingSessionState,
+)
+async def get_session(
+    session_id: str,
+    sessions: CrewSessionManager = Injected(CrewSessionManager),
+):
+    return _session_state(_get_session(sessions, session_id))
+
+
+@router.get(
+    "/sessions/{session_id}/events",
+    summary="Long-poll the next event of a cooking session",
+    description=(
+        "Returns the next question from the crew or the final outcome, "
+        "or 204 when nothing happened within the timeout"
+    ),
+    status_code=status.HTTP_200_OK,
+)
+async def get_session_event(
+    session_id: str,
+    timeout: float = Query(default=25, gt=0, le=60),
+    sessions: CrewSessionManager = Injected(CrewSessionManager),
+):
+    event = await _get_session(sessions, session_id).next_event(timeout=timeout)
+    if event is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    return event
+
+
+@router.post(
+    "/sessions/{session_id}/answers",
+    summary="Answer a question asked by the crew",
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def answer_session(
+    session_id: str,
+    request: CookingSessionAnswer,
+    sessions: CrewSessionManager = Injected(CrewSessionManager),
+) -> None:
+    session = _get_session(sessions, session_id)
+
+    try:
+        session.answer(request.text, request.question_id)
+    except SessionClosedError:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Cooking session is closed",
+        )
+    except UnknownQuestionError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="No pending question to answer",
+        )
+
+
+@router.delete(
+    "/sessions/{session_id}",
+    summary="Cancel a cooking session",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_session(
+    session_id: str,
+    sessions: CrewSessionManager = Injected(CrewSessionManager),
+) -> None:
+    try:
+        sessions.close(session_id)
+    except SessionNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cooking session not found",
+        )
+
+
+@router.get(
+    "/substitutions/cache",
+    summary="Substitution cache metrics",
+    status_code=status.HTTP_200_OK,
+    response_model=SubstitutionCacheMetrics,
+)
+async def get_substitution_cache_metrics(
+    cache: SubstitutionCache = Injected(SubstitutionCache),
+):
+    stats = cache.stats()
+    return SubstitutionCacheMetrics(
+        size=stats.size,
+        hits=stats.hits,
+        semantic_hits=stats.semantic_hits,
+        misses=stats.misses,
+        evictions=stats.evictions,
+        expirations=stats.expirations,
+        hit_rate=stats.hit_rate,
+    )
+
+
+@router.websocket("/sessions/{session_id}/ws")
+async def session_websocket(
+    websocket: WebSocket,
+    session_id: str,
+    sessions: CrewSessionManager = Injected(CrewSessionManager),
+) -> None:
+    try:
+        session = sessions.get(session_id)
+    except SessionNotFoundError:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+
+    async def send_events() -> None:
+        while True:
+            event = await session.next_event(timeout=30)
+            if event is None:
+                continue
+
+            await websocket.send_json(event)
+            if event["type"] != "question":
+                return
+
+    async def receive_answers() -> None:
+        while True:
+            try:
+                answer = CookingSessionAnswer.model_validate(await websocket.receive_json())
+                session.answer(answer.text, answer.question_id)
+            except (ValueError, UnknownQuestionError):
+                await websocket.send_json({"type": "error", "error": "Invalid answer or no pending question"})
+            except SessionClosedError:
+                return
+
+    sender = asyncio.create_task(send_events())
+    receiver = asyncio.create_task(receive_answers())
+
+    try:
+        done, pending = await asyncio.wait(
+            {sender, receiver},
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        for task in pending:
+            task.cancel()
+        for task in done:
+            task.result()
+        await websocket.close()
+    except WebSocketDisconnect:
+        sender.cancel()
+        receiver.cancel()
+
+
+@router.post(
+    "/recipe-steps/webhook",
+    summary="Receive recipe_steps changes",
+    description=(
+        "Supabase database webhook on recipe_steps; pushes the change to "
+        "the recipe's event stream subscribers"
+    ),
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def recipe_steps_webhook(
+    request: RecipeStepWebhook,
+    x_webhook_secret: str | None = Header(default=None),
+    hub: StepEventHub = Injected(StepEventHub),
+) -> None:
+    # Without a configured secret nobody can be trusted to publish step events
+    if not config.STEP_WEBHOOK_SECRET or not secrets.compare_digest(
+        x_webhook_secret or "",
+        config.STEP_WEBHOOK_SECRET,
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid webhook secret",
+        )
+
+    if request.type == "DELETE":
+        if request.old_record is not None:
+            hub.remove_step(request.old_record)
+    elif request.record is not None:
+        hub.update_step(request.record)
+
+
+async def _access_token(supabase: SupabaseService, authorization: str | None) -> str:
+    """The caller's Supabase access token, once Supabase Auth has accepted it."""
+    if not supabase.configured:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Supabase is not configured",
+        )
+
+    scheme, _, access_token = (authorization or "").partition(" ")
+    access_token = access_token.strip()
+    try:
+        if scheme.lower() != "bearer" or not access_token:
+            raise SupabaseAuthError()
+        await supabase.authenticate(access_token)
+    except SupabaseAuthError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing access token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return access_token
+
+
+def _sse(event: str, data: object) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.get(
+    "/recipes/{recipe_id}/events",
+    summary="Stream step and timer updates of a recipe",
+    description=(
+        "Server-sent events: a snapshot of the known steps, then every step "
+        "status change and schedule-derived timer as it happens. Needs the "
+        "caller's Supabase access token as a bearer token"
+    ),
+    status_code=status.HTTP_200_OK,
+)
+async def recipe_events(
+    recipe_id: str,
+    authorization: str | None = Header(default=None),
+    hub: StepEventHub = Injected(StepEventHub),
+    supabase: SupabaseService = Injected(SupabaseService),
+):
+    access_token = await _access_token(supabase, authorization)
 
-    with os.fdopen(fd, 'wb') as tmp_file:
-        audio_data = await audio.read()
-        tmp_file.write(audio_data)
+    # Seeded with the caller's token, so row level security decides what it reads
+    load_steps = partial(supabase.recipe_steps, access_token=access_token)
 
-    transcription = await GroqService().stt(audio_file_path=tmp_file_path)
+    async def stream() -> AsyncIterator[str]:
+        async with hub.subscribe(recipe_id) as events:
+            snapshot = await hub.snapshot(recipe_id, load_steps)
+            steps = [step.model_dump(mode="json") for step in snapshot]
+            yield "retry: 3000\n\n"
+            yield _sse("snapshot", {"type": "snapshot", "steps": steps})
 
-    return {"transcription: ", transcription}
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        events.get(),
+                        timeout=config.STEP_EVENTS_HEARTBEAT_SECONDS,
+                    )
+                except TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": heartbeat\n\n"
+                    continue
 
+                yield _sse(event["type"], event)
 
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,166 @@
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import AsyncIterator
+
+
+class Priority(IntEnum):
+    LIVE = 0
+    BACKGROUND = 1
+
+
+class AdmissionRejectedError(Exception):
+    def __init__(self, provider: str, retry_after: int) -> None:
+        super().__init__(f"{provider} is at capacity, retry after {retry_after}s")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class ProviderLimiter:
+    """
+    Token bucket plus max-concurrency gate in front of one upstream provider.
+
+    Requests that cannot start immediately wait in a bounded priority queue,
+    live requests ahead of background ones. When the queue is full a live
+    request displaces the newest background waiter; otherwise the request is
+    rejected up front with a Retry-After estimate instead of waiting to hit the
+    provider's own quota. Waiting longer than ``max_wait`` is also rejected.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        rate_per_second: float,
+        burst: int,
+        max_concurrency: int,
+        max_queue: int,
+        max_wait: float,
+    ) -> None:
+        self.name = name
+        self._rate = rate_per_second
+        self._burst = burst
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._in_flight = 0
+        self._waiters: list[_Waiter] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.future.done())
+
+    @asynccontextmanager
+    async def admit(self, priority: Priority = Priority.LIVE) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: Priority = Priority.LIVE) -> None:
+        self._refill()
+        if not self.queued and self._try_start():
+            return
+
+        if self.queued >= self._max_queue and not self._displace(priority):
+            raise self._rejection()
+
+        waiter = _Waiter(
+            priority=priority,
+            sequence=next(self._sequence),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._waiters, waiter)
+        self._dispatch()
+
+        try:
+            async with asyncio.timeout(self._max_wait):
+                await waiter.future
+        except TimeoutError:
+            # Granted in the same loop iteration the timeout fired, the slot is ours
+            if self._granted(waiter):
+                return
+            raise self._rejection()
+        except asyncio.CancelledError:
+            # Granted right before being cancelled, hand the slot back
+            if self._granted(waiter):
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+
+    def _try_start(self) -> bool:
+        if self._in_flight >= self._max_concurrency or self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        self._in_flight += 1
+        return True
+
+    def _dispatch(self) -> None:
+        self._refill()
+
+        while self._waiters:
+            if self._waiters[0].future.done():
+                heapq.heappop(self._waiters)
+                continue
+
+            if not self._try_start():
+                break
+
+            heapq.heappop(self._waiters).future.set_result(None)
+
+        if self._waiters and self._in_flight < self._max_concurrency and self._timer is None:
+            delay = (1 - self._tokens) / self._rate
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    @staticmethod
+    def _granted(waiter: _Waiter) -> bool:
+        future = waiter.future
+        return future.done() and not future.cancelled() and future.exception() is None
+
+    def _displace(self, priority: Priority) -> bool:
+        pending = [waiter for waiter in self._waiters if not waiter.future.done()]
+        victim = max(pending, default=None)
+        if victim is None or victim.priority <= priority:
+            return False
+
+        victim.future.set_exception(self._rejection())
+        return True
+
+    def _rejection(self) -> AdmissionRejectedError:
+        retry_after = max(1, math.ceil((self.queued + 1) / self._rate))
+        return AdmissionRejectedError(self.name, retry_after)
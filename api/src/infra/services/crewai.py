@@ -0,0 +1,349 @@
+from concurrent.futures import Future
+from textwrap import dedent
+from typing import Any, Callable, Literal, Type
+
+from crewai import Agent, Crew, Process, Task
+from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.tasks.task_output import TaskOutput
+from crewai.tools import BaseTool
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.domain.scheduler import Step, schedule_steps
+from src.infra.services.substitution_cache import SubstitutionCache, SubstitutionKey
+
+
+class CrewStoppedError(Exception):
+    pass
+
+
+class ConcurrentTask(Task):
+    """
+    Task that can run with ``async_execution`` without hanging the crew.
+
+    crewai runs an asynchronous task on its own thread and only resolves the
+    task's future on success, so the crew waits forever on a task that raised.
+    Here the error resolves the future as well and kickoff() re-raises it.
+    """
+
+    def _execute_task_async(
+        self,
+        agent: BaseAgent | None,
+        context: str | None,
+        tools: list[Any] | None,
+        future: Future[TaskOutput],
+    ) -> None:
+        try:
+            result = self._execute_core(agent, context, tools)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+class AskUserInput(BaseModel):
+    question: str = Field(..., description="Question to ask the user.")
+
+
+class AskUserTool(BaseTool):
+    name: str = "ask_user"
+    description: str = "Ask the user for clarification or confirmation"
+    args_schema: Type[BaseModel] = AskUserInput
+    ask: Callable[[str], str]
+
+    def _run(self, question: str) -> str:
+        return self.ask(question)
+
+
+class ScheduleStepInput(BaseModel):
+    name: str = Field(..., description="Unique name of the step.")
+    duration: int = Field(..., description="Time required to complete the step, in minutes.")
+    step_type: Literal["passive", "partial", "active"] = Field(
+        ...,
+        description="'active' needs the cook's full attention, 'partial' needs a burner or occasional attention, 'passive' runs unattended.",
+    )
+    predecessors: list[str] = Field(default_factory=list, description="Names of steps that must finish before this one.")
+
+
+class ScheduleRecipeInput(BaseModel):
+    steps: list[ScheduleStepInput] = Field(..., description="All recipe steps with their timing metadata.")
+    max_partial: int = Field(2, ge=1, description="Maximum number of partial steps that can run at the same time.")
+
+
+class ScheduleRecipeTool(BaseTool):
+    # Not result_as_answer: crewai would make an error message the task's final
+    # output, while a plain observation lets the agent fix the steps and retry
+    name: str = "schedule_recipe"
+    description: str = "Compute the start and finish time of every recipe step respecting dependencies and kitchen capacity"
+    args_schema: Type[BaseModel] = ScheduleRecipeInput
+
+    def _run(self, steps: list[dict], max_partial: int = 2) -> str:
+        try:
+            return schedule_steps(
+                [Step(**ScheduleStepInput.model_validate(step).model_dump()) for step in steps],
+                max_partial,
+            )
+        except ValueError as error:
+            return f"{error} Fix the steps and call schedule_recipe again."
+
+
+class SuggestSubstitutionInput(BaseModel):
+    missing_ingredient: str = Field(..., description="Ingredient the user does not have.")
+    recipe_context: str = Field(..., description="Name of the dish the ingredient is used in.")
+    dietary_constraints: list[str] = Field(default_factory=list, description="User's dietary restrictions, e.g. vegan, gluten-free.")
+
+
+class SuggestSubstitutionTool(BaseTool):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str = "suggest_substitution"
+    description: str = "Get substitution advice for one missing ingredient; common substitutions are answered from a shared cache"
+    args_schema: Type[BaseModel] = SuggestSubstitutionInput
+    cache: SubstitutionCache
+    generate: Callable[[str], str]
+
+    def _run(
+        self,
+        missing_ingredient: str,
+        recipe_context: str,
+        dietary_constraints: list[str] | None = None,
+    ) -> str:
+        key = SubstitutionKey.build(missing_ingredient, recipe_context, dietary_constraints)
+        advice = self.cache.get(key)
+        if advice is not None:
+            return advice
+
+        constraints = ", ".join(dietary_constraints or []) or "none"
+        advice = self.generate(dedent(f"""
+            Suggest the best substitutes for {missing_ingredient} in {recipe_context}.
+            Dietary constraints: {constraints}.
+            For each substitute give the amount relative to the original and
+            briefly explain why it works. Answer in at most five lines.
+        """))
+        self.cache.put(key, advice)
+        return advice
+
+
+class CookingCrew:
+    """
+    Crew of cooking agents whose ask_user questions go through ``ask_user``.
+
+    ``ask_user`` is called from the thread running the crew and must block
+    until the answer is available. When ``substitution_cache`` is given the
+    substituter answers through it instead of re-deriving common substitutions.
+    ``should_stop`` is checked after every agent step and before substitution
+    LLM calls; once it returns True the crew raises CrewStoppedError instead of
+    spending more tokens.
+    """
+
+    def __init__(
+        self,
+        ask_user: Callable[[str], str],
+        substitution_cache: SubstitutionCache | None = None,
+        should_stop: Callable[[], bool] | None = None,
+        verbose: bool = False,
+    ) -> None:
+        self._should_stop = should_stop
+
+        # Initialize the agents
+        self.head_chef = Agent(
+            role='Head Chef',
+            goal='Coordinate cooking activities and ensure successful recipe execution',
+            backstory=dedent("""
+                You are an experienced head chef with excellent communication skills.
+                Your main responsibility is to guide the cook through the recipe while
+                coordinating with other specialized agents. You're patient, clear in your
+                instructions, and always ready to help.
+                
+                When you need clarification:
+                1. Ask specific, clear questions
+                2. Wait for the user's response
+                3. Adapt your instructions based on their answer
+                
+                Always maintain a friendly and supportive tone.
+            """),
+            verbose=verbose,
+            allow_delegation=True,
+            tools=[
+                AskUserTool(ask=ask_user)
+            ]
+        )
+
+        self.ingredient_substituter = Agent(
+            role='Ingredient Substitution Specialist',
+            goal='Find the best possible substitutions for ingredients',
+            backstory=dedent("""
+                You are an expert in ingredient substitutions with deep knowledge of
+                flavors, textures, and cooking chemistry. You can suggest the best
+                alternatives based on available ingredients while maintaining the
+                dish's integrity.
+                
+                When suggesting substitutions:
+                1. Ask the user about specific dietary restrictions if relevant
+                2. Confirm if suggested substitutions are available
+                3. Explain why the substitution works well
+            """),
+            verbose=verbose,
+            tools=[
+                AskUserTool(ask=ask_user)
+            ]
+        )
+
+        if substitution_cache is not None:
+            self.ingredient_substituter.tools.append(
+                SuggestSubstitutionTool(
+                    cache=substitution_cache,
+                    generate=self._generate_substitution,
+                )
+            )
+
+        self.time_keeper = Agent(
+            role='Kitchen Timer and Schedule Manager',
+            goal='Track cooking times and manage multiple timing-dependent tasks',
+            backstory=dedent("""
+                You are responsible for managing all time-sensitive aspects of cooking.
+                You keep track of multiple timers, remind about upcoming steps, and
+                ensure nothing gets overcooked or forgotten.
+                
+                When managing time:
+                1. Ask about user's cooking equipment if needed
+                2. Confirm if specific timing instructions are clear
+                3. Check if user needs more time between steps
+            """),
+            verbose=verbose,
+            tools=[
+                AskUserTool(ask=ask_user),
+                ScheduleRecipeTool()
+            ]
+        )
+
+    def create_recipe_tasks(self, recipe: dict, available_ingredients: list[str]) -> list[Task]:
+        """
+        Create tasks based on the recipe and available ingredients.
+
+        Substitution and timing don't depend on each other, so both run
+        asynchronously and the guidance task waits on them through its context.
+        When every step already carries its timing metadata (name, duration,
+        step_type, predecessors) the schedule is computed up front and the
+        time keeper is not needed at all.
+        """
+        steps = recipe['steps']
+        schedule = None
+        if steps and all(isinstance(step, dict) for step in steps):
+            schedule = schedule_steps(
+                [Step(**ScheduleStepInput.model_validate(step).model_dump()) for step in steps],
+                recipe.get('max_partial', 2),
+            )
+            steps = [step['name'] for step in steps]
+
+        # Task for ingredient check and substitution
+        substitution_task = ConcurrentTask(
+            description=dedent(f"""
+                Review the recipe ingredients: {recipe['ingredients']}
+                Compare with available ingredients: {available_ingredients}
+                
+                For each ingredient that needs substitution:
+                1. Ask the user about dietary restrictions or preferences
+                2. Suggest alternatives and confirm their availability
+                3. Explain why the substitution would work well
+                
+                If the suggest_substitution tool is available, use it for each
+                missing ingredient instead of working out the substitution yourself.
+                
+                Communicate all findings to the Head Chef.
+                
+                Remember to use the ask_user tool when you need clarification about:
+                - Dietary restrictions
+                - Ingredient preferences
+                - Availability of specific substitutes
+            """),
+            agent=self.ingredient_substituter,
+            expected_output="Ingredient substitutions and clarifications for the Head Chef.",
+            async_execution=True
+        )
+
+        if schedule is None:
+            # Task for timing management
+            timing_task = ConcurrentTask(
+                description=dedent(f"""
+                    Review the recipe steps: {steps}
+                    
+                    Before creating the timing schedule:
+                    1. Ask about available cooking equipment if needed
+                    2. Confirm if user has any time constraints
+                    3. Check if user needs extra time between steps
+                    
+                    Then describe every step with:
+                    - a unique name
+                    - its duration in minutes
+                    - its type: 'active' (needs the cook's full attention),
+                      'partial' (occupies a burner, occasional attention) or
+                      'passive' (runs unattended, e.g. boiling water, oven)
+                    - the names of the steps that must finish before it
+                    
+                    and call the schedule_recipe tool with those steps and the number of
+                    burners available as max_partial. Do not write the schedule yourself,
+                    the tool computes it. If the tool reports a problem, fix the steps
+                    and call it again. Your final answer is the tool's schedule, unchanged.
+                    
+                    Use the ask_user tool to clarify any timing-related questions about:
+                    - Available equipment
+                    - Time constraints
+                    - Preferred pace of cooking
+                """),
+                agent=self.time_keeper,
+                expected_output="Cooking time schedule with the start and finish time of every step.",
+                async_execution=True
+            )
+            timing = "Follow the TimeKeeper's schedule for timing"
+            tasks = [substitution_task, timing_task]
+        else:
+            timing = "Follow the cooking schedule below for timing"
+            tasks = [substitution_task]
+
+        # Main cooking guidance task, fed by the previous tasks once they finish
+        guidance_task = Task(
+            description=dedent(f"""
+                Guide the cook through the recipe execution:
+                1. Review ingredient substitutions if any
+                2. Explain each step clearly
+                3. {timing}
+                4. Answer any questions from the cook
+                5. Provide technique tips and explanations
+                
+                Throughout the process:
+                - Ask for clarification when needed
+                - Confirm understanding of important steps
+                - Check if user needs more detailed explanations
+                
+                Recipe steps: {steps}
+                
+                Use the ask_user tool whenever you need to:
+                - Clarify understanding
+                - Confirm technique execution
+                - Check if more explanation is needed
+                - Verify completion of critical steps
+            """) + (f"\nCooking schedule:\n{schedule}\n" if schedule else ""),
+            agent=self.head_chef,
+            expected_output="Step-by-step cooking guidance and answers to cook's questions.",
+            context=list(tasks)
+        )
+
+        return tasks + [guidance_task]
+
+    def kickoff(self, recipe: dict, available_ingredients: list[str]) -> str:
+        crew = Crew(
+            agents=[self.head_chef, self.ingredient_substituter, self.time_keeper],
+            tasks=self.create_recipe_tasks(recipe, available_ingredients),
+            process=Process.sequential,
+            step_callback=self._check_stop,
+        )
+
+        return str(crew.kickoff())
+
+    def _check_stop(self, _step: Any = None) -> None:
+        if self._should_stop is not None and self._should_stop():
+            raise CrewStoppedError()
+
+    def _generate_substitution(self, prompt: str) -> str:
+        self._check_stop()
+        return str(self.ingredient_substituter.llm.call(prompt))
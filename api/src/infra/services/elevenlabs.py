@@ -1,23 +1,59 @@
-from elevenlabs.client import ElevenLabs
+from typing import AsyncIterator
+
+from elevenlabs.client import AsyncElevenLabs
 
 from src.config import config
+from src.infra.services.admission import Priority, ProviderLimiter
 
 class ElevenlabsService:
     def __init__(
         self,
+        limiter: ProviderLimiter,
     ) -> None:
-        self._elevenlabs_client = ElevenLabs(api_key=config.ELEVENLABS_API_KEY)
+        self._elevenlabs_client = AsyncElevenLabs(
+            api_key=config.ELEVENLABS_API_KEY,
+            base_url=config.ELEVENLABS_BASE_URL,
+        )
+        self._limiter = limiter
 
     async def generate(
         self,
-        text: str
-    ):
-        stream = self._elevenlabs_client.generate(
-            text=text,
-            voice="JBFqnCBsd6RMkjVDRZzb",
-            model="eleven_multilingual_v2",
-            stream=True
-        )
+        text: str,
+        priority: Priority = Priority.LIVE,
+    ) -> AsyncIterator[bytes]:
+        # Admission and the first upstream chunk happen before the response starts,
+        # so rejections and provider errors surface as HTTP errors, not cut streams
+        await self._limiter.acquire(priority)
+        stream = self._stream(text)
+        first_chunk = await anext(stream, None)
+
+        return self._prepend(first_chunk, stream)
 
-        for chunk in stream:
+    @staticmethod
+    async def _prepend(
+        first_chunk: bytes | None,
+        stream: AsyncIterator[bytes]
+    ) -> AsyncIterator[bytes]:
+        if first_chunk is None:
+            return
+
+        yield first_chunk
+        async for chunk in stream:
             yield chunk
+
+    async def _stream(
+        self,
+        text: str
+    ) -> AsyncIterator[bytes]:
+        try:
+            stream = await self._elevenlabs_client.generate(
+                text=text,
+                voice="JBFqnCBsd6RMkjVDRZzb",
+                model="eleven_multilingual_v2",
+                stream=True
+            )
+
+            async for chunk in stream:
+                yield chunk
+        finally:
+            self._limiter.release()
@@ -1,23 +1,28 @@
 import fal_client
 
 from src.config import config
+from src.infra.services.admission import Priority, ProviderLimiter
 
 class FalService:
     def __init__(
         self,
+        limiter: ProviderLimiter,
     ) -> None:
         self._fala_ai_client = fal_client
+        self._limiter = limiter
 
     async def stt(
         self,
-        audio_file_path: str
+        audio_file_path: str,
+        priority: Priority = Priority.LIVE,
     ):
-        handler = self._fala_ai_client.subscribe(
-        "fal-ai/whisper",
-            arguments={
-                "audio_url": audio_file_path
-            },
-        )
+        async with self._limiter.admit(priority):
+            handler = await self._fala_ai_client.subscribe_async(
+            "fal-ai/whisper",
+                arguments={
+                    "audio_url": audio_file_path
+                },
+            )
 
         print(handler)
         # return handler.text
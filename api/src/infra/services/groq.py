@@ -1,22 +1,30 @@
-from groq import Groq
+from groq import AsyncGroq
 from src.config import config
+from src.infra.services.admission import Priority, ProviderLimiter
 
 class GroqService:
     def __init__(
         self,
+        limiter: ProviderLimiter,
     ) -> None:
-        self._groq_client = Groq(api_key=config.GROQ_API_KEY)
+        self._groq_client = AsyncGroq(
+            api_key=config.GROQ_API_KEY,
+            base_url=config.GROQ_BASE_URL,
+        )
+        self._limiter = limiter
 
     async def stt(
         self,
-        audio_file_path: str
+        audio_file_path: str,
+        priority: Priority = Priority.LIVE,
     ):
-        with open(audio_file_path, "rb") as file:
-            transcription = self._groq_client.audio.transcriptions.create(
-            file=(audio_file_path, file.read()),
-            model="whisper-large-v3-turbo",
-            response_format="json",
+        async with self._limiter.admit(priority):
+            with open(audio_file_path, "rb") as file:
+                transcription = await self._groq_client.audio.transcriptions.create(
+                file=(audio_file_path, file.read()),
+                model="whisper-large-v3-turbo",
+                response_format="json",
 
-        )
+            )
 
         return transcription.text
@@ -0,0 +1,354 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from typing import Any, Callable
+
+from src.infra.services.crewai import CookingCrew, CrewStoppedError
+
+
+class SessionStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    WAITING_FOR_USER = "waiting_for_user"
+    FINISHED = "finished"
+    FAILED = "failed"
+    EXPIRED = "expired"
+    CANCELLED = "cancelled"
+
+
+FINAL_STATUSES = frozenset(
+    {
+        SessionStatus.FINISHED,
+        SessionStatus.FAILED,
+        SessionStatus.EXPIRED,
+        SessionStatus.CANCELLED,
+    }
+)
+
+
+class SessionClosedError(Exception):
+    pass
+
+
+class SessionLimitError(Exception):
+    pass
+
+
+class SessionNotFoundError(Exception):
+    pass
+
+
+class UnknownQuestionError(Exception):
+    pass
+
+
+class CrewSession:
+    """
+    State of one cooking conversation.
+
+    Questions raised by the crew thread are published on a bounded event queue
+    and the thread blocks until ``answer`` resolves the matching future or the
+    answer timeout elapses. Publishing never blocks: a client that stops reading
+    loses its oldest events, while unanswered questions stay listed in
+    ``pending_questions``.
+    """
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        *,
+        loop: asyncio.AbstractEventLoop,
+        answer_timeout: float,
+        max_events: int,
+        history_size: int,
+    ) -> None:
+        self.id = uuid.uuid4().hex
+        self.status = SessionStatus.QUEUED
+        self.result: str | None = None
+        self.error: str | None = None
+        self.created_at = time.monotonic()
+        self.last_activity = self.created_at
+        self.finished_at: float | None = None
+        self.history: deque[dict[str, str]] = deque(maxlen=history_size)
+
+        self._loop = loop
+        self._answer_timeout = answer_timeout
+        self._events: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_events)
+        self._pending: dict[str, asyncio.Future[str]] = {}
+
+    @property
+    def is_closed(self) -> bool:
+        return self.status in FINAL_STATUSES
+
+    @property
+    def pending_questions(self) -> list[str]:
+        return list(self._pending)
+
+    def touch(self) -> None:
+        self.last_activity = time.monotonic()
+
+    def ask_blocking(self, question: str) -> str:
+        """Entry point for the crew's ask_user tool, runs on the worker thread."""
+        if self.is_closed:
+            raise SessionClosedError(self.id)
+
+        future = asyncio.run_coroutine_threadsafe(self._ask(question), self._loop)
+        return future.result()
+
+    async def _ask(self, question: str) -> str:
+        if self.is_closed:
+            raise SessionClosedError(self.id)
+
+        question_id = uuid.uuid4().hex
+        answer = self._loop.create_future()
+        self._pending[question_id] = answer
+        self.status = SessionStatus.WAITING_FOR_USER
+        self.history.append({"role": "assistant", "text": question})
+
+        try:
+            self._publish({"type": "question", "id": question_id, "text": question})
+            return await asyncio.wait_for(answer, timeout=self._answer_timeout)
+        except TimeoutError:
+            self._logger.info(
+                msg="Question timed out",
+                extra={"session_id": self.id, "question_id": question_id},
+            )
+            return "The user did not answer. Continue with your best judgement."
+        finally:
+            self._pending.pop(question_id, None)
+            if not self._pending and not self.is_closed:
+                self.status = SessionStatus.RUNNING
+
+    def answer(self, text: str, question_id: str | None = None) -> None:
+        if self.is_closed:
+            raise SessionClosedError(self.id)
+
+        if question_id is None:
+            # Oldest pending question first, matching the order they were published
+            question_id = next(iter(self._pending), None)
+
+        answer = self._pending.get(question_id) if question_id else None
+        if answer is None or answer.done():
+            raise UnknownQuestionError(question_id)
+
+        self.touch()
+        self.history.append({"role": "user", "text": text})
+        answer.set_result(text)
+
+    async def next_event(self, timeout: float) -> dict[str, Any] | None:
+        """Wait for the next question or the final outcome, ``None`` on timeout."""
+        self.touch()
+        # The final event may already have been consumed by another client
+        if self.is_closed and self._events.empty():
+            return self.final_event()
+
+        try:
+            return await asyncio.wait_for(self._events.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+    def final_event(self) -> dict[str, Any]:
+        return {"type": self.status.value, "result": self.result, "error": self.error}
+
+    def mark_running(self) -> None:
+        if not self.is_closed:
+            self.status = SessionStatus.RUNNING
+
+    def close(self, status: SessionStatus, *, result: str | None = None, error: str | None = None) -> None:
+        if self.is_closed:
+            return
+
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = time.monotonic()
+
+        for answer in self._pending.values():
+            if not answer.done():
+                answer.set_exception(SessionClosedError(self.id))
+        self._pending.clear()
+
+        self._publish(self.final_event())
+
+    def _publish(self, event: dict[str, Any]) -> None:
+        # Drop the oldest undelivered event rather than block on a full queue
+        if self._events.full():
+            self._events.get_nowait()
+        self._events.put_nowait(event)
+
+
+class CrewSessionManager:
+    """
+    Runs many CookingCrew sessions inside the API process.
+
+    Crews are synchronous, so each one runs on a worker thread while all
+    session state lives on the event loop. A crew holds its thread while it
+    waits for an answer, so the pool has a worker for every allowed session
+    and a new session never queues behind crews that are waiting on people.
+    Sessions are bounded in number, lifetime, time spent queued, idle time and
+    per-session buffered events. A closed session keeps
+    counting against ``max_sessions`` until its crew thread has stopped, which
+    happens at the crew's next step once it sees the session is closed.
+    """
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        *,
+        crew_factory: Callable[..., CookingCrew] = CookingCrew,
+        max_sessions: int,
+        session_ttl: float,
+        queue_timeout: float,
+        idle_timeout: float,
+        answer_timeout: float,
+        result_retention: float,
+        max_events: int,
+        history_size: int,
+        reap_interval: float = 5.0,
+    ) -> None:
+        self._crew_factory = crew_factory
+        self._max_sessions = max_sessions
+        self._session_ttl = session_ttl
+        self._queue_timeout = queue_timeout
+        self._idle_timeout = idle_timeout
+        self._answer_timeout = answer_timeout
+        self._result_retention = result_retention
+        self._max_events = max_events
+        self._history_size = history_size
+        self._reap_interval = reap_interval
+
+        self._sessions: dict[str, CrewSession] = {}
+        self._crews: dict[str, asyncio.Future[str | None]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._reaper: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_sessions,
+            thread_name_prefix="crew-session",
+        )
+        self._reaper = asyncio.create_task(self._reap())
+
+    async def stop(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
+        for session in self._sessions.values():
+            session.close(SessionStatus.CANCELLED)
+        self._sessions.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def active_sessions(self) -> int:
+        # Queued or running crews, including those of closed sessions still winding down
+        return len(self._crews)
+
+    def create(self, recipe: dict, available_ingredients: list[str]) -> CrewSession:
+        if self._executor is None:
+            raise RuntimeError("Session manager is not started")
+
+        if self.active_sessions >= self._max_sessions:
+            raise SessionLimitError(self._max_sessions)
+
+        loop = asyncio.get_running_loop()
+        session = CrewSession(
+            loop=loop,
+            answer_timeout=self._answer_timeout,
+            max_events=self._max_events,
+            history_size=self._history_size,
+        )
+        self._sessions[session.id] = session
+
+        future = self._crews[session.id] = loop.run_in_executor(
+            self._executor,
+            self._run_crew,
+            session,
+            loop,
+            recipe,
+            available_ingredients,
+        )
+        future.add_done_callback(lambda done: self._on_crew_done(session, done))
+
+        return session
+
+    def get(self, session_id: str) -> CrewSession:
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise SessionNotFoundError(session_id)
+
+        return session
+
+    def close(self, session_id: str) -> None:
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            raise SessionNotFoundError(session_id)
+
+        session.close(SessionStatus.CANCELLED)
+
+    def _run_crew(
+        self,
+        session: CrewSession,
+        loop: asyncio.AbstractEventLoop,
+        recipe: dict,
+        available_ingredients: list[str],
+    ) -> str | None:
+        # Cancelled or expired while waiting for a free worker
+        if session.is_closed:
+            return None
+
+        loop.call_soon_threadsafe(session.mark_running)
+        crew = self._crew_factory(
+            session.ask_blocking,
+            should_stop=lambda: session.is_closed,
+        )
+        return crew.kickoff(recipe, available_ingredients)
+
+    def _on_crew_done(self, session: CrewSession, future: asyncio.Future[str | None]) -> None:
+        self._crews.pop(session.id, None)
+
+        if future.cancelled():
+            session.close(SessionStatus.CANCELLED)
+            return
+
+        error = future.exception()
+        if error is None:
+            session.close(SessionStatus.FINISHED, result=future.result())
+        elif not isinstance(error, (SessionClosedError, CrewStoppedError)):
+            self._logger.error(
+                msg="Crew session failed",
+                extra={"session_id": session.id},
+                exc_info=error,
+            )
+            session.close(SessionStatus.FAILED, error=str(error))
+
+    async def _reap(self) -> None:
+        while True:
+            await asyncio.sleep(self._reap_interval)
+            now = time.monotonic()
+
+            for session_id, session in list(self._sessions.items()):
+                if session.is_closed:
+                    if now - (session.finished_at or now) > self._result_retention:
+                        del self._sessions[session_id]
+                elif now - session.created_at > self._session_ttl:
+                    session.close(SessionStatus.EXPIRED, error="Session lifetime exceeded")
+                elif (
+                    session.status == SessionStatus.QUEUED
+                    and now - session.created_at > self._queue_timeout
+                ):
+                    session.close(SessionStatus.EXPIRED, error="No crew worker became available")
+                elif (
+                    session.status == SessionStatus.WAITING_FOR_USER
+                    and now - session.last_activity > self._idle_timeout
+                ):
+                    session.close(SessionStatus.EXPIRED, error="Session idle for too long")
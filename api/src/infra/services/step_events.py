@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from src.domain.models import RecipeStep, StepStatus
+
+
+@dataclass
+class _RecipeState:
+    steps: dict[str, RecipeStep] = field(default_factory=dict)
+    seeded: bool = False
+    touched_at: float = 0.0
+
+
+class StepEventHub:
+    """
+    In-process pub/sub of recipe step changes, fanned out per recipe.
+
+    Step updates come from the recipe_steps webhook. The hub keeps the last
+    known state of each step of unfinished recipes so new subscribers start
+    from a snapshot; the first snapshot of a recipe is seeded through the
+    subscriber's ``load_steps`` so it also covers rows written before this
+    process started. Seeded steps are shared with later subscribers of the
+    recipe, like webhook updates are.
+    Timer events are scheduled from the predicted times: a heads-up ``lead``
+    seconds before a step should start or finish, and one when it is due.
+
+    Recipes without subscribers are dropped after ``recipe_ttl`` seconds
+    without activity, or least recently active first beyond ``max_recipes``.
+    Each subscriber has a bounded queue; a slow subscriber loses its oldest
+    events rather than holding back the others.
+    """
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        *,
+        max_queue: int,
+        lead: float,
+        max_recipes: int,
+        recipe_ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_queue = max_queue
+        self._lead = lead
+        self._max_recipes = max_recipes
+        self._recipe_ttl = recipe_ttl
+        self._clock = clock
+
+        self._subscribers: dict[str, set[asyncio.Queue[dict[str, Any]]]] = defaultdict(set)
+        self._recipes: OrderedDict[str, _RecipeState] = OrderedDict()
+        self._seeding: dict[str, asyncio.Task[None]] = {}
+        self._timers: dict[str, list[asyncio.TimerHandle]] = {}
+
+    @property
+    def recipes(self) -> int:
+        return len(self._recipes)
+
+    def stop(self) -> None:
+        for task in self._seeding.values():
+            task.cancel()
+        self._seeding.clear()
+
+        for handles in self._timers.values():
+            for handle in handles:
+                handle.cancel()
+        self._timers.clear()
+
+    async def snapshot(
+        self,
+        recipe_id: str,
+        load_steps: Callable[[str], Awaitable[list[RecipeStep]]] | None = None,
+    ) -> list[RecipeStep]:
+        state = self._recipes.get(recipe_id)
+        if load_steps is not None and (state is None or not state.seeded):
+            # Concurrent subscribers of the same recipe share one load
+            seeding = self._seeding.get(recipe_id)
+            if seeding is None:
+                seeding = self._seeding[recipe_id] = asyncio.create_task(
+                    self._seed(recipe_id, load_steps)
+                )
+            await asyncio.shield(seeding)
+
+        state = self._recipes.get(recipe_id)
+        if state is None:
+            return []
+
+        self._touch(recipe_id, state)
+        return sorted(state.steps.values(), key=lambda step: step.step_number)
+
+    @asynccontextmanager
+    async def subscribe(self, recipe_id: str) -> AsyncIterator[asyncio.Queue[dict[str, Any]]]:
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=self._max_queue)
+        self._subscribers[recipe_id].add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(recipe_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[recipe_id]
+
+            state = self._recipes.get(recipe_id)
+            if state is not None:
+                self._touch(recipe_id, state)
+
+    def update_step(self, step: RecipeStep) -> None:
+        state = self._recipes.get(step.recipe_id)
+        if state is None:
+            state = self._recipes[step.recipe_id] = _RecipeState()
+
+        self._set_step(state, step)
+        self._touch(step.recipe_id, state)
+
+        self.publish(step.recipe_id, {"type": "step", "step": step.model_dump(mode="json")})
+
+        # Nothing left to push once the whole recipe is done
+        if all(known.status == StepStatus.FINISHED for known in state.steps.values()):
+            self._drop(step.recipe_id)
+
+        self._evict()
+
+    def remove_step(self, step: RecipeStep) -> None:
+        self._cancel_timers(step.id)
+        state = self._recipes.get(step.recipe_id)
+        if state is not None:
+            state.steps.pop(step.id, None)
+            if not state.steps:
+                del self._recipes[step.recipe_id]
+
+        self.publish(step.recipe_id, {"type": "step_removed", "step_id": step.id})
+
+    def publish(self, recipe_id: str, event: dict[str, Any]) -> None:
+        for queue in self._subscribers.get(recipe_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _seed(
+        self,
+        recipe_id: str,
+        load_steps: Callable[[str], Awaitable[list[RecipeStep]]],
+    ) -> None:
+        try:
+            steps = await load_steps(recipe_id)
+        except Exception as error:
+            self._logger.error(
+                msg="Loading recipe steps failed",
+                extra={"recipe_id": recipe_id, "error": str(error)},
+            )
+            return
+        finally:
+            self._seeding.pop(recipe_id, None)
+
+        state = self._recipes.get(recipe_id)
+        if state is None:
+            state = self._recipes[recipe_id] = _RecipeState()
+
+        for step in steps:
+            # Webhook updates that arrived while loading are newer than the loaded rows
+            if step.id not in state.steps:
+                self._set_step(state, step)
+
+        state.seeded = True
+        self._touch(recipe_id, state)
+        self._evict()
+
+    def _set_step(self, state: _RecipeState, step: RecipeStep) -> None:
+        self._cancel_timers(step.id)
+        state.steps[step.id] = step
+        self._schedule_timers(step)
+
+    def _touch(self, recipe_id: str, state: _RecipeState) -> None:
+        state.touched_at = self._clock()
+        self._recipes.move_to_end(recipe_id)
+
+    def _drop(self, recipe_id: str) -> None:
+        state = self._recipes.pop(recipe_id, None)
+        if state is not None:
+            for step_id in state.steps:
+                self._cancel_timers(step_id)
+
+    def _evict(self) -> None:
+        now = self._clock()
+
+        # Least recently active first; subscribed recipes are kept however old
+        for recipe_id, state in list(self._recipes.items()):
+            expired = now - state.touched_at > self._recipe_ttl
+            if not expired and len(self._recipes) <= self._max_recipes:
+                break
+            if recipe_id not in self._subscribers:
+                self._drop(recipe_id)
+
+    def _cancel_timers(self, step_id: str) -> None:
+        for handle in self._timers.pop(step_id, []):
+            handle.cancel()
+
+    def _schedule_timers(self, step: RecipeStep) -> None:
+        if step.predicted_start_time is None or step.predicted_end_time is None:
+            return
+
+        if step.status == StepStatus.IN_PROGRESS:
+            # Same rule as mark-step-started: predicted duration from the actual start
+            started = step.actual_start_time or step.predicted_start_time
+            due = started + (step.predicted_end_time - step.predicted_start_time)
+            kind = "finish"
+        elif step.status in (StepStatus.UNABLE_TO_START, StepStatus.READY_TO_START):
+            due = step.predicted_start_time
+            kind = "start"
+        else:
+            return
+
+        if due.tzinfo is None:
+            due = due.replace(tzinfo=timezone.utc)
+
+        loop = asyncio.get_running_loop()
+        now = datetime.now(timezone.utc)
+        handles = []
+
+        for at, name, seconds_left in (
+            (due - timedelta(seconds=self._lead), f"{kind}_soon", self._lead),
+            (due, f"{kind}_due", 0),
+        ):
+            delay = (at - now).total_seconds()
+            if delay < 0:
+                continue
+
+            event = {
+                "type": "timer",
+                "timer": name,
+                "step_id": step.id,
+                "step_number": step.step_number,
+                "description": step.description,
+                "due_at": due.isoformat(),
+                "seconds_left": seconds_left,
+            }
+            handles.append(loop.call_later(delay, self.publish, step.recipe_id, event))
+
+        if handles:
+            self._timers[step.id] = handles
@@ -0,0 +1,193 @@
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+SparseVector = dict[str, float]
+
+_QUANTITY_PATTERN = re.compile(
+    r"\b(a|an|some|of|to taste|"
+    r"g|kg|mg|ml|l|oz|lb|lbs|cups?|tbsp|tablespoons?|tsp|teaspoons?|"
+    r"cloves?|pinch(es)?|handfuls?|bunch(es)?|slices?|cans?|pieces?)\b"
+)
+_NON_WORD_PATTERN = re.compile(r"[^a-z ]+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop digits, units and punctuation, sort the remaining words."""
+    # Digits go with the punctuation, which leaves "200g" as a bare unit for _QUANTITY_PATTERN
+    text = _NON_WORD_PATTERN.sub(" ", text.lower())
+    text = _QUANTITY_PATTERN.sub(" ", text)
+    return " ".join(sorted(text.split()))
+
+
+def trigram_embedding(text: str) -> SparseVector:
+    """Character trigram counts, unit-normalized; good enough for near-duplicate wording."""
+    padded = f"  {text} "
+    counts = Counter(padded[i:i + 3] for i in range(len(padded) - 2))
+    norm = math.sqrt(sum(value * value for value in counts.values())) or 1.0
+    return {gram: value / norm for gram, value in counts.items()}
+
+
+def cosine_similarity(left: SparseVector, right: SparseVector) -> float:
+    if len(left) > len(right):
+        left, right = right, left
+    return sum(value * right.get(gram, 0.0) for gram, value in left.items())
+
+
+@dataclass(frozen=True)
+class SubstitutionKey:
+    missing_ingredient: str
+    recipe_context: str
+    dietary_constraints: tuple[str, ...]
+
+    @classmethod
+    def build(
+        cls,
+        missing_ingredient: str,
+        recipe_context: str,
+        dietary_constraints: list[str] | None = None,
+    ) -> "SubstitutionKey":
+        constraints = {normalize_text(item) for item in dietary_constraints or []}
+        return cls(
+            missing_ingredient=normalize_text(missing_ingredient),
+            recipe_context=normalize_text(recipe_context),
+            dietary_constraints=tuple(sorted(item for item in constraints if item)),
+        )
+
+
+@dataclass
+class _Entry:
+    key: SubstitutionKey
+    embedding: SparseVector
+    advice: str
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class SubstitutionCacheStats:
+    size: int
+    hits: int
+    semantic_hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.semantic_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.semantic_hits) / self.lookups if self.lookups else 0.0
+
+
+class SubstitutionCache:
+    """
+    Process-wide cache of ingredient substitution advice.
+
+    Exact lookups use the normalized key; otherwise the entry for the same
+    normalized ingredient and dietary constraints whose recipe context is
+    closest is returned when the context similarity reaches
+    ``similarity_threshold``. The ingredient itself must match exactly: advice
+    for a similarly spelled ingredient (salted vs unsalted butter) is wrong
+    advice. Entries expire after ``ttl`` seconds and the least
+    recently used entry is evicted beyond ``max_size``. Safe to share between
+    crew worker threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl: float,
+        similarity_threshold: float,
+        embed: Callable[[str], SparseVector] = trigram_embedding,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._similarity_threshold = similarity_threshold
+        self._embed = embed
+        self._clock = clock
+
+        self._entries: OrderedDict[SubstitutionKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: SubstitutionKey) -> str | None:
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.advice
+
+            entry = self._closest(key, now)
+            if entry is not None:
+                self._entries.move_to_end(entry.key)
+                self._semantic_hits += 1
+                return entry.advice
+
+            self._misses += 1
+            return None
+
+    def put(self, key: SubstitutionKey, advice: str) -> None:
+        embedding = self._embed(key.recipe_context)
+
+        with self._lock:
+            self._entries[key] = _Entry(
+                key=key,
+                embedding=embedding,
+                advice=advice,
+                expires_at=self._clock() + self._ttl,
+            )
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> SubstitutionCacheStats:
+        with self._lock:
+            return SubstitutionCacheStats(
+                size=len(self._entries),
+                hits=self._hits,
+                semantic_hits=self._semantic_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
+
+    def _closest(self, key: SubstitutionKey, now: float) -> _Entry | None:
+        # Linear scan is fine at the configured sizes; expired entries are purged on the way
+        embedding = self._embed(key.recipe_context)
+        best: _Entry | None = None
+        best_score = self._similarity_threshold
+
+        for entry_key, entry in list(self._entries.items()):
+            if entry.expires_at <= now:
+                del self._entries[entry_key]
+                self._expirations += 1
+                continue
+
+            if (
+                entry_key.missing_ingredient != key.missing_ingredient
+                or entry_key.dietary_constraints != key.dietary_constraints
+            ):
+                continue
+
+            score = cosine_similarity(embedding, entry.embedding)
+            if score >= best_score:
+                best, best_score = entry, score
+
+        return best
@@ -0,0 +1,69 @@
+import httpx
+
+from src.config import config
+from src.domain.models import RecipeStep
+
+
+class SupabaseAuthError(Exception):
+    pass
+
+
+class SupabaseService:
+    """
+    Supabase Auth and PostgREST access on behalf of the calling user.
+
+    Requests carry the project's anon key and the caller's access token, so
+    row level security applies exactly as it does for the edge functions.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        if config.SUPABASE_URL and config.SUPABASE_ANON_KEY:
+            self._client = httpx.AsyncClient(
+                base_url=config.SUPABASE_URL.rstrip("/"),
+                headers={"apikey": config.SUPABASE_ANON_KEY},
+                timeout=config.SUPABASE_TIMEOUT_SECONDS,
+            )
+
+    @property
+    def configured(self) -> bool:
+        return self._client is not None
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def authenticate(self, access_token: str) -> None:
+        """Check the access token with Supabase Auth, SupabaseAuthError when it is not valid."""
+        response = await self._get("/auth/v1/user", access_token)
+        if response.status_code in (httpx.codes.UNAUTHORIZED, httpx.codes.FORBIDDEN):
+            raise SupabaseAuthError()
+        response.raise_for_status()
+
+    async def recipe_steps(self, recipe_id: str, access_token: str) -> list[RecipeStep]:
+        response = await self._get(
+            "/rest/v1/recipe_steps",
+            access_token,
+            params={
+                "recipe_id": f"eq.{recipe_id}",
+                "order": "step_number.asc",
+            },
+        )
+        response.raise_for_status()
+
+        return [RecipeStep.model_validate(row) for row in response.json()]
+
+    async def _get(
+        self,
+        path: str,
+        access_token: str,
+        params: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        if self._client is None:
+            raise RuntimeError("Supabase is not configured")
+
+        return await self._client.get(
+            path,
+            params=params,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
@@ -0,0 +1,128 @@
+import os
+import threading
+from functools import partial
+from typing import Any, Callable
+
+import pytest
+
+# Crews are built offline in the tests, keep crewai from reporting telemetry
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from crewai import LLM  # noqa: E402
+
+from src.config import Config  # noqa: E402
+from src.domain.models import RecipeStep  # noqa: E402
+from src.infra.services.admission import ProviderLimiter  # noqa: E402
+from src.infra.services.crewai import CookingCrew  # noqa: E402
+from src.infra.services.sessions import CrewSessionManager  # noqa: E402
+from src.infra.services.step_events import StepEventHub  # noqa: E402
+from src.infra.services.substitution_cache import SubstitutionCache  # noqa: E402
+
+FINAL_ANSWER = "Thought: I now know the final answer\nFinal Answer: {}"
+
+# Small, fast settings; tests override the one they exercise by keyword
+make_limiter = partial(
+    ProviderLimiter,
+    name="provider",
+    rate_per_second=1000,
+    burst=100,
+    max_concurrency=1,
+    max_queue=10,
+    max_wait=1,
+)
+make_manager = partial(
+    CrewSessionManager,
+    max_sessions=10,
+    session_ttl=60,
+    queue_timeout=60,
+    idle_timeout=60,
+    answer_timeout=5,
+    result_retention=60,
+    max_events=4,
+    history_size=10,
+    reap_interval=60,
+)
+make_cache = partial(SubstitutionCache, max_size=16, ttl=60, similarity_threshold=0.85)
+make_hub = partial(StepEventHub, max_queue=10, lead=30, max_recipes=100, recipe_ttl=60)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_config(**values: str) -> Config:
+    required = {
+        "ELEVENLABS_API_KEY": "key",
+        "HOST": "0.0.0.0",
+        "PORT": "8000",
+        "FAL_KEY": "key",
+        "GROQ_API_KEY": "key",
+    }
+    return Config.model_validate({**required, **values})
+
+
+def make_step(step_id: str, recipe_id: str = "recipe", number: int = 1, **fields: Any) -> RecipeStep:
+    return RecipeStep(
+        id=step_id,
+        recipe_id=recipe_id,
+        step_number=number,
+        description=f"step {step_id}",
+        **fields,
+    )
+
+
+class FakeLLM(LLM):
+    """Answers every call through ``respond`` instead of a provider."""
+
+    def __init__(self, respond: Callable[[], str]) -> None:
+        super().__init__(model="fake")
+        self._respond = respond
+
+    def call(self, messages: Any, *args: Any, **kwargs: Any) -> str:
+        return self._respond()
+
+
+def answer(text: str) -> FakeLLM:
+    return FakeLLM(lambda: FINAL_ANSWER.format(text))
+
+
+def fail(error: Exception) -> FakeLLM:
+    def respond() -> str:
+        raise error
+
+    return FakeLLM(respond)
+
+
+def make_crew(llm: LLM, *, substituter_llm: LLM | None = None, **options: Any) -> CookingCrew:
+    options.setdefault("ask_user", lambda question: "yes")
+    crew = CookingCrew(**options)
+
+    crew.head_chef.llm = llm
+    crew.ingredient_substituter.llm = substituter_llm or llm
+    crew.time_keeper.llm = llm
+    return crew
+
+
+def run_in_thread(target: Callable[[], Any], timeout: float) -> Any:
+    """Run ``target`` on a daemon thread so a hang fails the test instead of the run."""
+    outcome: dict[str, Any] = {}
+
+    def run() -> None:
+        try:
+            outcome["result"] = target()
+        except BaseException as error:
+            outcome["error"] = error
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+
+    if thread.is_alive():
+        pytest.fail(f"Still running after {timeout}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+import pytest
+
+from src.infra.services.admission import AdmissionRejectedError, Priority
+from tests.conftest import make_limiter
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_burst_is_admitted_immediately_then_paced_by_the_rate():
+    async def scenario():
+        limiter = make_limiter(rate_per_second=20, burst=2, max_concurrency=10)
+
+        started = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+        elapsed = time.monotonic() - started
+
+        # Two from the burst, two more at 20/s
+        assert 0.08 <= elapsed < 0.5
+        assert limiter.in_flight == 4
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_gate_starts_the_next_waiter_on_release():
+    async def scenario():
+        limiter = make_limiter(max_concurrency=2)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await settle()
+        assert not waiter.done()
+        assert limiter.queued == 1
+
+        limiter.release()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert limiter.in_flight == 2
+        assert limiter.queued == 0
+
+    asyncio.run(scenario())
+
+
+def test_live_waiters_start_before_earlier_background_ones():
+    async def scenario():
+        limiter = make_limiter()
+        await limiter.acquire()
+        order: list[str] = []
+
+        async def request(name: str, priority: Priority) -> None:
+            async with limiter.admit(priority):
+                order.append(name)
+
+        tasks = [asyncio.create_task(request("background", Priority.BACKGROUND))]
+        await settle()
+        tasks.append(asyncio.create_task(request("live", Priority.LIVE)))
+        await settle()
+
+        limiter.release()
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        assert order == ["live", "background"]
+        assert limiter.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_rejects_background_and_live_displaces_background():
+    async def scenario():
+        limiter = make_limiter(max_queue=1)
+        await limiter.acquire()
+
+        queued = asyncio.create_task(limiter.acquire(Priority.BACKGROUND))
+        await settle()
+
+        with pytest.raises(AdmissionRejectedError) as rejected:
+            await limiter.acquire(Priority.BACKGROUND)
+        assert rejected.value.retry_after >= 1
+
+        live = asyncio.create_task(limiter.acquire(Priority.LIVE))
+        await settle()
+        with pytest.raises(AdmissionRejectedError):
+            await queued
+
+        limiter.release()
+        await asyncio.wait_for(live, timeout=1)
+        assert limiter.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_waiting_longer_than_max_wait_is_rejected():
+    async def scenario():
+        limiter = make_limiter(max_wait=0.05)
+        await limiter.acquire()
+
+        with pytest.raises(AdmissionRejectedError):
+            await limiter.acquire()
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+    asyncio.run(scenario())
+
+
+def test_slot_granted_as_max_wait_fires_is_kept():
+    async def scenario():
+        limiter = make_limiter(max_wait=0.05)
+        await limiter.acquire()
+
+        # Armed before the waiter's timeout, so it runs first in the same loop iteration
+        asyncio.get_running_loop().call_later(0.05, limiter.release)
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        time.sleep(0.1)
+
+        await asyncio.wait_for(waiter, timeout=1)
+        assert limiter.in_flight == 1
+
+        limiter.release()
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+    asyncio.run(scenario())
+
+
+def test_slot_granted_to_a_cancelled_waiter_is_released():
+    async def scenario():
+        limiter = make_limiter()
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await settle()
+
+        limiter.release()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+    asyncio.run(scenario())
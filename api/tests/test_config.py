@@ -0,0 +1,15 @@
+from tests.conftest import make_config
+
+
+def test_empty_base_urls_fall_back_to_the_provider_defaults():
+    config = make_config(ELEVENLABS_BASE_URL="", GROQ_BASE_URL="")
+
+    assert config.ELEVENLABS_BASE_URL is None
+    assert config.GROQ_BASE_URL is None
+
+
+def test_base_urls_are_kept_when_set():
+    config = make_config(GROQ_BASE_URL="http://127.0.0.1:9000")
+
+    assert config.GROQ_BASE_URL == "http://127.0.0.1:9000"
+    assert config.ELEVENLABS_BASE_URL is None
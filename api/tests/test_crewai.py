@@ -0,0 +1,27 @@
+import pytest
+
+from src.infra.services.crewai import CrewStoppedError
+from tests.conftest import answer, fail, make_crew, run_in_thread
+
+RECIPE = {"ingredients": ["eggs", "flour"], "steps": ["mix", "bake"]}
+
+
+def test_kickoff_returns_the_guidance():
+    crew = make_crew(answer("enjoy"))
+
+    assert run_in_thread(lambda: crew.kickoff(RECIPE, ["flour"]), timeout=10) == "enjoy"
+
+
+def test_failing_concurrent_task_fails_the_kickoff():
+    crew = make_crew(answer("enjoy"), substituter_llm=fail(RuntimeError("provider down")))
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        run_in_thread(lambda: crew.kickoff(RECIPE, ["flour"]), timeout=10)
+
+
+
+def test_stopping_during_the_concurrent_tasks_ends_the_kickoff():
+    crew = make_crew(answer("enjoy"), should_stop=lambda: True)
+
+    with pytest.raises(CrewStoppedError):
+        run_in_thread(lambda: crew.kickoff(RECIPE, ["flour"]), timeout=10)
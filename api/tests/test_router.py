@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.domain.models import RecipeStep, RecipeStepWebhook
+from src.infra.http import router
+from src.infra.services.step_events import StepEventHub
+from src.infra.services.supabase import SupabaseAuthError
+from tests.conftest import make_config, make_hub, make_step
+
+
+def use_config(monkeypatch: pytest.MonkeyPatch, **values: str) -> None:
+    monkeypatch.setattr(router, "config", make_config(**values))
+
+
+def step_webhook() -> RecipeStepWebhook:
+    return RecipeStepWebhook(
+        type="INSERT",
+        table="recipe_steps",
+        record=make_step("a"),
+    )
+
+
+def deliver(secret: str | None) -> StepEventHub:
+    hub = make_hub()
+
+    async def scenario():
+        await router.recipe_steps_webhook(step_webhook(), x_webhook_secret=secret, hub=hub)
+
+    asyncio.run(scenario())
+    return hub
+
+
+@pytest.mark.parametrize("secret", [None, "", "guess"])
+def test_webhook_is_rejected_while_no_secret_is_configured(monkeypatch, secret):
+    use_config(monkeypatch, STEP_WEBHOOK_SECRET="")
+
+    with pytest.raises(HTTPException) as rejected:
+        deliver(secret)
+    assert rejected.value.status_code == 401
+
+
+def test_webhook_needs_the_configured_secret(monkeypatch):
+    use_config(monkeypatch, STEP_WEBHOOK_SECRET="s3cret")
+
+    with pytest.raises(HTTPException) as rejected:
+        deliver("guess")
+    assert rejected.value.status_code == 401
+
+    assert deliver("s3cret").recipes == 1
+
+
+class FakeSupabase:
+    def __init__(self, *, configured: bool = True) -> None:
+        self.configured = configured
+        self.loads: list[tuple[str, str]] = []
+
+    async def authenticate(self, access_token: str) -> None:
+        if access_token != "user-token":
+            raise SupabaseAuthError()
+
+    async def recipe_steps(self, recipe_id: str, access_token: str) -> list[RecipeStep]:
+        self.loads.append((recipe_id, access_token))
+        return [make_step("a", recipe_id=recipe_id)]
+
+
+def open_events(supabase: FakeSupabase, authorization: str | None) -> list[str]:
+    hub = make_hub()
+
+    async def scenario() -> list[str]:
+        response = await router.recipe_events(
+            "recipe",
+            authorization=authorization,
+            hub=hub,
+            supabase=supabase,
+        )
+        chunks = response.body_iterator
+        try:
+            return [await anext(chunks), await anext(chunks)]
+        finally:
+            await chunks.aclose()
+
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("authorization", [None, "", "Bearer", "Basic user-token", "Bearer forged"])
+def test_events_need_a_valid_access_token(authorization):
+    supabase = FakeSupabase()
+
+    with pytest.raises(HTTPException) as rejected:
+        open_events(supabase, authorization)
+    assert rejected.value.status_code == 401
+    assert supabase.loads == []
+
+
+def test_events_are_unavailable_without_supabase():
+    with pytest.raises(HTTPException) as rejected:
+        open_events(FakeSupabase(configured=False), "Bearer user-token")
+    assert rejected.value.status_code == 503
+
+
+def test_events_snapshot_is_loaded_with_the_callers_token():
+    supabase = FakeSupabase()
+
+    _, snapshot = open_events(supabase, "Bearer user-token")
+
+    assert supabase.loads == [("recipe", "user-token")]
+    assert snapshot.startswith("event: snapshot\n")
+    assert '"id": "a"' in snapshot
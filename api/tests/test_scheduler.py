@@ -0,0 +1,106 @@
+import pytest
+from pydantic import ValidationError
+
+from src.domain.models import Recipe
+from src.domain.scheduler import Step, recipe_topo_sort, schedule_steps
+from src.infra.services.crewai import ScheduleRecipeTool
+
+
+def test_one_active_step_at_a_time_and_passive_steps_run_alongside():
+    steps = {
+        "chop": Step("chop", 5, "active"),
+        "peel": Step("peel", 3, "active"),
+        "preheat": Step("preheat", 10, "passive"),
+        "bake": Step("bake", 20, "passive", ["chop", "peel", "preheat"]),
+    }
+
+    schedule = recipe_topo_sort(steps, max_partial=2)
+
+    assert schedule == [
+        ("chop", 0, 5),
+        ("preheat", 0, 10),
+        ("peel", 5, 8),
+        ("bake", 10, 30),
+    ]
+
+
+def test_partial_steps_are_limited_to_max_partial():
+    steps = {name: Step(name, 10, "partial") for name in ("sear", "saute", "simmer")}
+
+    starts = {name: start for name, start, _ in recipe_topo_sort(steps, max_partial=2)}
+
+    assert sorted(starts.values()) == [0, 0, 10]
+
+
+def test_steps_in_a_cycle_are_left_out():
+    steps = {
+        "a": Step("a", 1, "active", ["b"]),
+        "b": Step("b", 1, "active", ["a"]),
+        "c": Step("c", 1, "active"),
+    }
+
+    assert recipe_topo_sort(steps, max_partial=1) == [("c", 0, 1)]
+
+
+def step_input(name: str, *predecessors: str, step_type: str = "active") -> Step:
+    return Step(name, 5, step_type, list(predecessors))
+
+
+def test_schedule_steps_formats_the_timeline():
+    timeline = schedule_steps([step_input("boil"), step_input("drain", "boil")], max_partial=2)
+
+    assert timeline.splitlines() == [
+        "   0-5    min: boil",
+        "   5-10   min: drain",
+        "Total time: 10 min",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("steps", "max_partial", "message"),
+    [
+        ([step_input("a", "missing")], 2, "Unknown predecessor steps: missing"),
+        ([step_input("a", "b"), step_input("b", "a")], 2, "cycle"),
+        ([step_input("a"), step_input("a")], 2, "unique"),
+        ([step_input("a", step_type="partial")], 0, "max_partial"),
+    ],
+)
+def test_schedule_steps_rejects_invalid_graphs(steps, max_partial, message):
+    with pytest.raises(ValueError, match=message):
+        schedule_steps(steps, max_partial)
+
+
+def test_schedule_tool_reports_errors_back_to_the_agent():
+    tool = ScheduleRecipeTool()
+
+    assert not tool.result_as_answer
+    result = tool._run(steps=[{"name": "a", "duration": 1, "step_type": "active", "predecessors": ["b"]}])
+    assert result.startswith("Unknown predecessor steps: b.")
+    assert result.endswith("call schedule_recipe again.")
+
+
+def timed_recipe(*steps: dict, max_partial: int = 2) -> dict:
+    return {"name": "pasta", "ingredients": ["pasta"], "steps": list(steps), "max_partial": max_partial}
+
+
+def timed_step(name: str, *predecessors: str) -> dict:
+    return {"name": name, "duration": 5, "step_type": "active", "predecessors": list(predecessors)}
+
+
+def test_recipe_accepts_plain_and_schedulable_timed_steps():
+    Recipe.model_validate({"name": "pasta", "ingredients": ["pasta"], "steps": ["boil"]})
+    Recipe.model_validate(timed_recipe(timed_step("boil"), timed_step("drain", "boil")))
+
+
+@pytest.mark.parametrize(
+    ("recipe", "message"),
+    [
+        (timed_recipe(timed_step("a", "b"), timed_step("b", "a")), "cycle"),
+        (timed_recipe(timed_step("a", "missing")), "Unknown predecessor"),
+        (timed_recipe(timed_step("a"), timed_step("a")), "unique"),
+        (timed_recipe(), "at least one step"),
+    ],
+)
+def test_recipe_rejects_steps_that_cannot_be_scheduled(recipe, message):
+    with pytest.raises(ValidationError, match=message):
+        Recipe.model_validate(recipe)
@@ -0,0 +1,223 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infra.services.crewai import CrewStoppedError
+from src.infra.services.sessions import (
+    CrewSession,
+    CrewSessionManager,
+    SessionClosedError,
+    SessionLimitError,
+    SessionStatus,
+)
+from tests.conftest import FINAL_ANSWER, FakeLLM, make_crew, make_manager
+
+
+class FakeCrew:
+    """Stands in for CookingCrew: asks one question, then takes one more step."""
+
+    def __init__(self, ask_user, should_stop=None, step: threading.Event | None = None) -> None:
+        self._ask_user = ask_user
+        self._should_stop = should_stop
+        self._step = step
+
+    def kickoff(self, recipe: dict, available_ingredients: list[str]) -> str:
+        answer = self._ask_user(f"Do you have {recipe['name']}?")
+        if self._step is not None:
+            self._step.wait()
+            if self._should_stop():
+                raise CrewStoppedError()
+        return f"done: {answer}"
+
+
+def test_question_and_answer_round_trip():
+    async def scenario():
+        manager = make_manager(crew_factory=FakeCrew)
+        await manager.start()
+        try:
+            session = manager.create({"name": "pasta"}, [])
+
+            question = await session.next_event(timeout=2)
+            assert question["type"] == "question"
+            assert session.status == SessionStatus.WAITING_FOR_USER
+
+            session.answer("yes", question["id"])
+            final = await session.next_event(timeout=2)
+
+            assert final == {"type": "finished", "result": "done: yes", "error": None}
+            assert manager.active_sessions == 0
+        finally:
+            await manager.stop()
+
+    asyncio.run(scenario())
+
+
+def test_closed_session_stops_its_crew_and_holds_the_slot_until_then():
+    step = threading.Event()
+
+    async def scenario():
+        manager = make_manager(
+            crew_factory=lambda ask_user, should_stop: FakeCrew(ask_user, should_stop, step),
+            max_sessions=1,
+        )
+        await manager.start()
+        try:
+            session = manager.create({"name": "pasta"}, [])
+            question = await session.next_event(timeout=2)
+            session.answer("yes", question["id"])
+
+            manager.close(session.id)
+            assert session.status == SessionStatus.CANCELLED
+
+            # The crew thread has not taken its next step yet, so it still holds the slot
+            assert manager.active_sessions == 1
+            with pytest.raises(SessionLimitError):
+                manager.create({"name": "soup"}, [])
+
+            step.set()
+            for _ in range(200):
+                if manager.active_sessions == 0:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert manager.active_sessions == 0
+            assert session.status == SessionStatus.CANCELLED
+            assert session.result is None
+            assert session.error is None
+            manager.create({"name": "soup"}, [])
+        finally:
+            step.set()
+            await manager.stop()
+
+    asyncio.run(scenario())
+
+
+async def wait_for_no_active_sessions(manager: CrewSessionManager) -> None:
+    for _ in range(500):
+        if manager.active_sessions == 0:
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_cancelling_during_the_concurrent_crew_tasks_frees_the_slot():
+    called = threading.Event()
+    release = threading.Event()
+
+    def respond() -> str:
+        called.set()
+        release.wait()
+        return FINAL_ANSWER.format("done")
+
+    async def scenario():
+        manager = make_manager(
+            crew_factory=lambda ask_user, should_stop: make_crew(
+                FakeLLM(respond),
+                ask_user=ask_user,
+                should_stop=should_stop,
+            ),
+            max_sessions=1,
+        )
+        await manager.start()
+        try:
+            session = manager.create({"ingredients": ["eggs"], "steps": ["boil"]}, [])
+            assert await asyncio.to_thread(called.wait, 10)
+
+            # The substitution and timing tasks are mid LLM call
+            manager.close(session.id)
+            release.set()
+
+            await wait_for_no_active_sessions(manager)
+            assert manager.active_sessions == 0
+            assert session.status == SessionStatus.CANCELLED
+            assert session.error is None
+        finally:
+            release.set()
+            await manager.stop()
+
+    asyncio.run(scenario())
+
+
+def test_every_allowed_session_gets_a_worker_while_others_wait_for_answers():
+    async def scenario():
+        manager = make_manager(crew_factory=FakeCrew, max_sessions=8)
+        await manager.start()
+        try:
+            sessions = [manager.create({"name": "pasta"}, []) for _ in range(8)]
+
+            questions = await asyncio.gather(*(session.next_event(timeout=2) for session in sessions))
+            assert all(question["type"] == "question" for question in questions)
+            assert all(session.status == SessionStatus.WAITING_FOR_USER for session in sessions)
+        finally:
+            await manager.stop()
+
+    asyncio.run(scenario())
+
+
+def test_session_queued_for_too_long_expires():
+    release = threading.Event()
+
+    async def scenario():
+        manager = make_manager(crew_factory=FakeCrew, queue_timeout=0.05, reap_interval=0.01)
+        await manager.start()
+        # A single busy worker, so the session can't leave the queue
+        manager._executor = ThreadPoolExecutor(max_workers=1)
+        manager._executor.submit(release.wait)
+        try:
+            session = manager.create({"name": "pasta"}, [])
+
+            final = await session.next_event(timeout=2)
+            assert final["type"] == "expired"
+            assert session.error == "No crew worker became available"
+
+            release.set()
+            await wait_for_no_active_sessions(manager)
+            assert manager.active_sessions == 0
+        finally:
+            release.set()
+            await manager.stop()
+
+    asyncio.run(scenario())
+
+
+def test_publishing_never_blocks_on_a_full_event_queue():
+    async def scenario():
+        session = CrewSession(
+            loop=asyncio.get_running_loop(),
+            answer_timeout=0.05,
+            max_events=1,
+            history_size=10,
+        )
+
+        # Nobody reads the events; both questions still time out instead of blocking
+        answers = await asyncio.wait_for(
+            asyncio.gather(session._ask("first?"), session._ask("second?")),
+            timeout=1,
+        )
+        assert all("did not answer" in answer for answer in answers)
+
+        session.close(SessionStatus.CANCELLED)
+        assert await session.next_event(timeout=0.1) == session.final_event()
+
+    asyncio.run(scenario())
+
+
+def test_close_releases_a_crew_waiting_for_an_answer():
+    async def scenario():
+        session = CrewSession(
+            loop=asyncio.get_running_loop(),
+            answer_timeout=5,
+            max_events=1,
+            history_size=10,
+        )
+        session._publish({"type": "question", "id": "filler", "text": "filler"})
+
+        asking = asyncio.create_task(session._ask("still there?"))
+        await asyncio.sleep(0)
+        session.close(SessionStatus.EXPIRED, error="Session idle for too long")
+
+        with pytest.raises(SessionClosedError):
+            await asyncio.wait_for(asking, timeout=1)
+
+    asyncio.run(scenario())
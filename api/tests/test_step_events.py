@@ -0,0 +1,145 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from src.domain.models import RecipeStep, StepStatus
+from src.infra.services.step_events import StepEventHub
+from tests.conftest import FakeClock, make_hub, make_step
+
+
+def test_first_snapshot_is_seeded_from_the_loader_once():
+    loads: list[str] = []
+
+    async def load_steps(recipe_id: str) -> list[RecipeStep]:
+        loads.append(recipe_id)
+        await asyncio.sleep(0.01)
+        return [make_step("b", number=2), make_step("a", number=1)]
+
+    async def scenario():
+        hub = make_hub()
+
+        first, second = await asyncio.gather(
+            hub.snapshot("recipe", load_steps),
+            hub.snapshot("recipe", load_steps),
+        )
+        assert [step.id for step in first] == ["a", "b"]
+        assert first == second
+
+        await hub.snapshot("recipe", load_steps)
+        assert loads == ["recipe"]
+
+    asyncio.run(scenario())
+
+
+def test_webhook_updates_received_while_seeding_win_over_loaded_rows():
+    async def scenario():
+        hub: StepEventHub
+
+        async def load_steps(recipe_id: str) -> list[RecipeStep]:
+            hub.update_step(make_step("a", status=StepStatus.IN_PROGRESS))
+            return [make_step("a", status=StepStatus.READY_TO_START), make_step("b", number=2)]
+
+        hub = make_hub()
+        steps = await hub.snapshot("recipe", load_steps)
+
+        assert [(step.id, step.status) for step in steps] == [
+            ("a", StepStatus.IN_PROGRESS),
+            ("b", StepStatus.READY_TO_START),
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_failed_seeding_falls_back_to_known_steps_and_is_retried():
+    calls = 0
+
+    async def load_steps(recipe_id: str) -> list[RecipeStep]:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ConnectionError("supabase is down")
+        return [make_step("a"), make_step("b", number=2)]
+
+    async def scenario():
+        hub = make_hub()
+        hub.update_step(make_step("b", number=2))
+
+        assert [step.id for step in await hub.snapshot("recipe", load_steps)] == ["b"]
+        assert [step.id for step in await hub.snapshot("recipe", load_steps)] == ["a", "b"]
+
+    asyncio.run(scenario())
+
+
+def test_subscribers_receive_step_events_and_finished_recipes_are_dropped():
+    async def scenario():
+        hub = make_hub()
+
+        async with hub.subscribe("recipe") as events:
+            hub.update_step(make_step("a"))
+            hub.update_step(make_step("a", status=StepStatus.FINISHED))
+
+            assert (await events.get())["step"]["status"] == "ready_to_start"
+            assert (await events.get())["step"]["status"] == "finished"
+
+        assert hub.recipes == 0
+        assert await hub.snapshot("recipe") == []
+
+    asyncio.run(scenario())
+
+
+def test_timer_events_fire_lead_seconds_before_and_when_due():
+    async def scenario():
+        hub = make_hub(lead=0.05)
+        start = datetime.now(timezone.utc) + timedelta(seconds=0.1)
+
+        async with hub.subscribe("recipe") as events:
+            hub.update_step(
+                make_step(
+                    "a",
+                    predicted_start_time=start,
+                    predicted_end_time=start + timedelta(minutes=5),
+                )
+            )
+            await events.get()
+
+            soon = await asyncio.wait_for(events.get(), timeout=1)
+            due = await asyncio.wait_for(events.get(), timeout=1)
+
+        assert (soon["timer"], due["timer"]) == ("start_soon", "start_due")
+        hub.stop()
+
+    asyncio.run(scenario())
+
+
+def test_idle_recipes_expire_unless_subscribed():
+    async def scenario():
+        clock = FakeClock()
+        hub = make_hub(recipe_ttl=60, clock=clock)
+
+        hub.update_step(make_step("a", recipe_id="idle"))
+        async with hub.subscribe("watched"):
+            hub.update_step(make_step("b", recipe_id="watched"))
+
+            clock.now = 61
+            hub.update_step(make_step("c", recipe_id="fresh"))
+
+            assert await hub.snapshot("idle") == []
+            assert [step.id for step in await hub.snapshot("watched")] == ["b"]
+            assert hub.recipes == 2
+
+    asyncio.run(scenario())
+
+
+def test_least_recently_active_recipes_are_evicted_beyond_max_recipes():
+    async def scenario():
+        hub = make_hub(max_recipes=2)
+
+        hub.update_step(make_step("a", recipe_id="first"))
+        hub.update_step(make_step("b", recipe_id="second"))
+        await hub.snapshot("first")
+        hub.update_step(make_step("c", recipe_id="third"))
+
+        assert hub.recipes == 2
+        assert await hub.snapshot("second") == []
+        assert [step.id for step in await hub.snapshot("first")] == ["a"]
+
+    asyncio.run(scenario())
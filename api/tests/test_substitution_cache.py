@@ -0,0 +1,90 @@
+import pytest
+
+from src.infra.services.substitution_cache import SubstitutionKey, normalize_text
+from tests.conftest import FakeClock, make_cache
+
+BOURGUIGNON = "slow cooker beef bourguignon with mushrooms and pearl onions"
+
+
+def test_normalize_text_drops_quantities_units_and_punctuation():
+    assert normalize_text("2 1/2 Cups All-Purpose Flour, 200g") == "all flour purpose"
+    assert normalize_text("3 cloves garlic") == "garlic"
+
+
+def test_exact_hit_ignores_wording_order_and_quantities():
+    cache = make_cache()
+    cache.put(SubstitutionKey.build("2 eggs", "Banana Bread", ["Vegan"]), "flax eggs")
+
+    assert cache.get(SubstitutionKey.build("eggs", "bread banana", ["vegan"])) == "flax eggs"
+    assert cache.stats().hits == 1
+
+
+def test_similar_recipe_context_for_the_same_ingredient_is_a_semantic_hit():
+    cache = make_cache()
+    cache.put(SubstitutionKey.build("eggs", BOURGUIGNON), "skip them")
+
+    key = SubstitutionKey.build(
+        "eggs",
+        "beef bourguignon with mushrooms and pearl onions in the slow cooker",
+    )
+    assert cache.get(key) == "skip them"
+    assert cache.stats().semantic_hits == 1
+
+
+@pytest.mark.parametrize(
+    ("cached", "asked", "context"),
+    [
+        ("eggs", "butter", BOURGUIGNON),
+        ("bacon", "thyme", BOURGUIGNON),
+        ("flour", "cornstarch", BOURGUIGNON),
+        ("salted butter", "unsalted butter", "cookies"),
+    ],
+)
+def test_a_different_ingredient_never_gets_cached_advice(cached, asked, context):
+    cache = make_cache()
+    cache.put(SubstitutionKey.build(cached, context), f"advice for {cached}")
+
+    assert cache.get(SubstitutionKey.build(asked, context)) is None
+    assert cache.stats().misses == 1
+
+
+def test_dietary_constraints_must_match_exactly():
+    cache = make_cache()
+    cache.put(SubstitutionKey.build("milk", "pancakes", ["vegan"]), "oat milk")
+
+    assert cache.get(SubstitutionKey.build("milk", "pancakes")) is None
+    assert cache.get(SubstitutionKey.build("milk", "pancakes", ["vegan", "nut-free"])) is None
+
+
+def test_unrelated_recipe_context_is_a_miss():
+    cache = make_cache()
+    cache.put(SubstitutionKey.build("milk", "pancakes"), "buttermilk")
+
+    assert cache.get(SubstitutionKey.build("milk", "beef stew")) is None
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = make_cache(clock=clock)
+    key = SubstitutionKey.build("milk", "pancakes")
+    cache.put(key, "buttermilk")
+
+    clock.now = 61
+    assert cache.get(key) is None
+    assert cache.stats().expirations == 1
+    assert cache.stats().size == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = make_cache(max_size=2)
+    milk = SubstitutionKey.build("milk", "pancakes")
+    eggs = SubstitutionKey.build("eggs", "pancakes")
+    cache.put(milk, "buttermilk")
+    cache.put(eggs, "banana")
+
+    cache.get(milk)
+    cache.put(SubstitutionKey.build("flour", "pancakes"), "oat flour")
+
+    assert cache.get(eggs) is None
+    assert cache.get(milk) == "buttermilk"
+    assert cache.stats().evictions == 1
@@ -0,0 +1,59 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.infra.services import supabase as supabase_module
+from src.infra.services.supabase import SupabaseAuthError, SupabaseService
+from tests.conftest import make_config
+
+
+def make_service(monkeypatch: pytest.MonkeyPatch, handler) -> SupabaseService:
+    monkeypatch.setattr(
+        supabase_module,
+        "config",
+        make_config(SUPABASE_URL="https://project.supabase.co/", SUPABASE_ANON_KEY="anon"),
+    )
+    service = SupabaseService()
+    service._client._transport = httpx.MockTransport(handler)
+    return service
+
+
+def test_recipe_steps_are_read_as_the_caller(monkeypatch):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[{"id": "a", "recipe_id": "r", "step_number": 1, "description": "boil"}])
+
+    async def scenario():
+        service = make_service(monkeypatch, handler)
+        steps = await service.recipe_steps("r", access_token="user-token")
+        await service.close()
+        return steps
+
+    steps = asyncio.run(scenario())
+
+    assert [step.id for step in steps] == ["a"]
+    (request,) = requests
+    assert request.url.path == "/rest/v1/recipe_steps"
+    assert request.url.params["recipe_id"] == "eq.r"
+    assert request.headers["authorization"] == "Bearer user-token"
+    assert request.headers["apikey"] == "anon"
+
+
+@pytest.mark.parametrize("status_code", [401, 403])
+def test_rejected_access_tokens_raise_an_auth_error(monkeypatch, status_code):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/auth/v1/user"
+        return httpx.Response(status_code, json={"msg": "invalid JWT"})
+
+    async def scenario():
+        service = make_service(monkeypatch, handler)
+        try:
+            await service.authenticate("forged")
+        finally:
+            await service.close()
+
+    with pytest.raises(SupabaseAuthError):
+        asyncio.run(scenario())
@@ -0,0 +1,159 @@
+"""
+Benchmark peak RSS and runtime of the notebook cleaning helpers against
+``recipe_cleaning``.
+
+Each variant runs in its own child process so ``ru_maxrss`` reflects only that
+pipeline (CSV load, best recipes, nutrition split, tag counts and output write).
+The number of rows each variant writes is reported alongside, so the timings
+are only compared when both produce the same output.
+"""
+
+import argparse
+import ast
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Dict
+
+import pandas as pd
+
+import recipe_cleaning
+
+
+# Reference implementation, copied from cleaning_data.ipynb
+def notebook_get_best_recipes(df_recipes, df_user_reviews, min_rating=3.9):
+    avg_ratings = df_user_reviews.groupby('recipe_id')['rating'].agg([
+        'mean',
+        'count'
+    ]).reset_index()
+    avg_ratings.columns = ['id', 'rating_mean', 'rating_count']
+    comments_by_recipe = df_user_reviews.groupby('recipe_id')['review'].agg(list).reset_index()
+    comments_by_recipe.columns = ['id', 'all_reviews']
+    recipes_with_ratings = pd.merge(df_recipes, avg_ratings, on='id', how='inner')
+    recipes_with_ratings = pd.merge(recipes_with_ratings, comments_by_recipe, on='id', how='left')
+    best_recipes = recipes_with_ratings[recipes_with_ratings['rating_mean'] >= min_rating]
+    best_recipes = best_recipes.sort_values('rating_mean', ascending=False)
+    return best_recipes
+
+
+def notebook_split_nutrition_column(df):
+    df_new = df.copy()
+    if isinstance(df_new['nutrition'].iloc[0], str):
+        df_new['nutrition'] = df_new['nutrition'].apply(ast.literal_eval)
+    # The notebook concatenated without resetting the sorted index, misaligning
+    # the nutrition rows so the following dropna() discarded most of them
+    df_new = df_new.reset_index(drop=True)
+    nutrition_df = pd.DataFrame(df_new['nutrition'].tolist(), columns=recipe_cleaning.NUTRITION_COLUMNS)
+    df_new = df_new.drop('nutrition', axis=1)
+    df_new = pd.concat([df_new, nutrition_df], axis=1)
+    return df_new
+
+
+def notebook_get_unique_tags(df):
+    if isinstance(df['tags'].iloc[0], str):
+        tags_lists = df['tags'].apply(ast.literal_eval)
+    else:
+        tags_lists = df['tags']
+    all_tags = []
+    for tags in tags_lists:
+        all_tags.extend(tags)
+    tag_counts = {}
+    for tag in all_tags:
+        tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    sorted_tag_counts = dict(sorted(tag_counts.items(), key=lambda x: x[1], reverse=True))
+    return list(sorted_tag_counts.keys()), sorted_tag_counts
+
+
+def run_notebook(recipes_path: str, interactions_path: str, output_dir: str) -> int:
+    df_recipes = pd.read_csv(recipes_path)
+    df_user_reviews = pd.read_csv(interactions_path)
+    df_best = notebook_get_best_recipes(df_recipes, df_user_reviews)
+    df_expanded = notebook_split_nutrition_column(df_best).dropna()
+    df_expanded.to_csv(os.path.join(output_dir, "enriched_cleaned_recipes.csv"))
+    notebook_get_unique_tags(df_expanded)
+    return len(df_expanded)
+
+
+def run_vectorized(recipes_path: str, interactions_path: str, output_dir: str) -> int:
+    df_recipes, df_user_reviews = recipe_cleaning.load_raw_data(recipes_path, interactions_path)
+    cleaned = recipe_cleaning.clean_recipes(df_recipes, df_user_reviews)
+    recipe_cleaning.write_parquet(cleaned, os.path.join(output_dir, "enriched_cleaned_recipes.parquet"))
+    recipe_cleaning.get_unique_tags(cleaned)
+    return len(cleaned)
+
+
+VARIANTS = {
+    "notebook": run_notebook,
+    "vectorized": run_vectorized,
+}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _worker(variant: str, recipes_path: str, interactions_path: str, queue) -> None:
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        rows = VARIANTS[variant](recipes_path, interactions_path, output_dir)
+        elapsed = time.perf_counter() - start
+    queue.put({"runtime_s": elapsed, "peak_rss_mb": _peak_rss_mb(), "rows": rows})
+
+
+def benchmark(variant: str, recipes_path: str, interactions_path: str) -> Dict[str, float]:
+    """Run one variant in a fresh process and return its runtime, peak RSS and output rows."""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(
+        target=_worker,
+        args=(variant, recipes_path, interactions_path, queue),
+    )
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the notebook cleaning helpers with recipe_cleaning"
+    )
+    parser.add_argument(
+        "--recipes-path",
+        default="../data/RAW_recipes.csv",
+        help="Path to RAW_recipes.csv"
+    )
+    parser.add_argument(
+        "--interactions-path",
+        default="../data/RAW_interactions.csv",
+        help="Path to RAW_interactions.csv"
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=1,
+        help="Number of runs per variant (best runtime is reported)"
+    )
+    args = parser.parse_args()
+
+    print(f"{'variant':<12}{'runtime (s)':>14}{'peak RSS (MB)':>16}{'rows':>10}")
+    row_counts = set()
+    for variant in VARIANTS:
+        runs = [
+            benchmark(variant, args.recipes_path, args.interactions_path)
+            for _ in range(args.repeat)
+        ]
+        runtime = min(run["runtime_s"] for run in runs)
+        peak_rss = max(run["peak_rss_mb"] for run in runs)
+        rows = runs[0]["rows"]
+        row_counts.add(rows)
+        print(f"{variant:<12}{runtime:>14.2f}{peak_rss:>16.1f}{rows:>10}")
+
+    if len(row_counts) > 1:
+        print("warning: variants wrote different row counts, timings are not comparable")